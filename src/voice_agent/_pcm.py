@@ -0,0 +1,32 @@
+"""Shared PCM energy primitives for VAD and wake detection.
+
+Both EnergyVAD and EnergyWakeDetector score int16 frames by mean-square
+energy; this module holds the single implementation they share. The numpy
+path reduces through one SIMD dot product, and the fallback sums squares
+over a memoryview cast. Everything stays in integer arithmetic: callers
+compare the sum of squares against threshold^2 * n, so no sqrt is taken.
+"""
+
+from __future__ import annotations
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+
+def sum_squares(data: bytes) -> "tuple[int, int]":
+    """Return (sum of squared samples, sample count) for one int16 frame."""
+    if np is not None:
+        # Widen to int64 before the dot product: an int32 accumulator wraps
+        # on a 20 ms frame at ordinary speech levels
+        samples = np.frombuffer(data, dtype=np.int16).astype(np.int64)
+        return int(np.dot(samples, samples)), len(samples)
+    samples = memoryview(data).cast("h")
+    return sum(s * s for s in samples), len(samples)
+
+
+def above_threshold(data: bytes, threshold_sq: int) -> bool:
+    """True when the frame's mean-square energy reaches threshold_sq."""
+    ss, n = sum_squares(data)
+    return n > 0 and ss >= threshold_sq * n
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import asyncio
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Callable, List, Optional
 
 from .config import AgentConfig
 from .dialog import DialogManager, DialogTurn
+from .http import aclose_client
 from .providers import build_llm, build_stt, build_tts
 from .session_store import SessionStore
 from .sub_agent import AgentOrchestrator, AgentResult
@@ -30,8 +32,14 @@ class VoiceAgentApp:
             session_store=self.session_store,
         )
 
-    async def handle_text(self, text: str) -> DialogTurn:
-        return await self.dialog.handle_user_text(text)
+    async def handle_text(
+        self,
+        text: str,
+        on_response_chunk: Optional[Callable[[str], Awaitable[None]]] = None,
+    ) -> DialogTurn:
+        """Handle one turn; on_response_chunk receives speech text as the
+        LLM streams, so TTS can start before the full response exists."""
+        return await self.dialog.handle_user_text(text, on_response_chunk=on_response_chunk)
 
     async def poll_background(self) -> List[DialogTurn]:
         return await self.dialog.poll_background()
@@ -56,16 +64,9 @@ class VoiceAgentApp:
         Returns:
             List of completed agent results
         """
-        if not self.orchestrator:
+        if not self.orchestrator or not self.orchestrator.has_activity():
             return []
-
-        results = []
-        while True:
-            result = await self.orchestrator.next_result(timeout=0)
-            if result is None:
-                break
-            results.append(result)
-        return results
+        return self.orchestrator.drain_results()
 
     def list_sub_agents(self) -> List[dict]:
         """List all sub-agents and their status."""
@@ -79,9 +80,13 @@ async def interactive_cli() -> None:
     app = VoiceAgentApp(config)
     print("Voice agent CLI prototype. Type 'run <cmd>' for foreground tool or 'runbg <cmd>' for background. Ctrl+C to exit.")
 
+    # One dedicated thread for blocking input() calls, so prompts do not
+    # contend with the shared default executor used for other blocking I/O.
+    loop = asyncio.get_running_loop()
+    input_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cli-input")
     try:
         while True:
-            user_text = await asyncio.to_thread(input, "\nYou: ")
+            user_text = await loop.run_in_executor(input_executor, input, "\nYou: ")
             if not user_text.strip():
                 continue
             turn = await app.handle_text(user_text)
@@ -100,6 +105,13 @@ async def interactive_cli() -> None:
 
     except KeyboardInterrupt:
         print("\nExiting.")
+    finally:
+        input_executor.shutdown(wait=False, cancel_futures=True)
+        # Let in-flight turn summaries land before the store closes, or the
+        # last turn's summary is dropped and a late write re-opens the store
+        await app.dialog.wait_for_summaries()
+        app.session_store.close()
+        await aclose_client()
 
 
 if __name__ == "__main__":
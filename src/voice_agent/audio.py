@@ -1,15 +1,59 @@
 from __future__ import annotations
 
 import asyncio
-import time
+import struct
+from collections import deque
 from dataclasses import dataclass
 from typing import AsyncIterator, Optional
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+# Frame backlog bound; at 30 ms frames this is ~6 s of audio. Stale frames
+# are useless to a real-time pipeline, so overflow drops the oldest.
+_FRAME_QUEUE_MAXLEN = 200
+
+
+def _wav_header(data_len: int, rate: int) -> bytes:
+    # Mono, 16-bit PCM: the 44-byte canonical RIFF header packed directly,
+    # skipping the wave module's BytesIO round trip.
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF",
+        36 + data_len,
+        b"WAVE",
+        b"fmt ",
+        16,
+        1,
+        1,
+        rate,
+        rate * 2,
+        2,
+        16,
+        b"data",
+        data_len,
+    )
+
+
+def pcm16_to_wav(pcm: bytes, rate: int) -> bytes:
+    """Frame mono 16-bit PCM as a WAV blob."""
+    return _wav_header(len(pcm), rate) + pcm
+
 
 @dataclass
 class AudioFrame:
+    # Seconds since capture start, derived from the frame counter; nothing
+    # downstream needs wall-clock time, so no clock read per frame.
     timestamp: float
-    data: bytes
+    data: bytes | memoryview
+
+    def samples(self) -> "Optional[np.ndarray]":
+        """Zero-copy int16 view of the PCM payload, or None without numpy."""
+        if np is None:
+            return None
+        return np.frombuffer(self.data, dtype=np.int16)
 
 
 class AudioFrontend:
@@ -17,7 +61,9 @@ class AudioFrontend:
         self.wake_word = wake_word
         self.sample_rate = sample_rate
         self.chunk_ms = chunk_ms
-        self._frames: asyncio.Queue[Optional[AudioFrame]] = asyncio.Queue()
+        self._frames: deque[Optional[AudioFrame]] = deque(maxlen=_FRAME_QUEUE_MAXLEN)
+        self._frame_index = 0
+        self._frame_ready = asyncio.Event()
         self._running = False
         self._stopped = asyncio.Event()
 
@@ -28,25 +74,33 @@ class AudioFrontend:
     async def stop(self) -> None:
         self._running = False
         self._stopped.set()
-        await self._frames.put(None)
+        self._frames.append(None)
+        self._frame_ready.set()
 
-    async def enqueue_frame(self, data: Optional[bytes]) -> None:
+    async def enqueue_frame(self, data: Optional[bytes | memoryview]) -> None:
         if not self._running:
             return
         if data is None:
-            await self._frames.put(None)
-            return
-        frame = AudioFrame(timestamp=time.time(), data=data)
-        await self._frames.put(frame)
+            self._frames.append(None)
+        else:
+            self._frames.append(AudioFrame(timestamp=self._frame_index * self.chunk_ms / 1000, data=data))
+            self._frame_index += 1
+        self._frame_ready.set()
 
     async def end_utterance(self) -> None:
         if not self._running:
             return
-        await self._frames.put(None)
+        self._frames.append(None)
+        self._frame_ready.set()
 
     async def frames(self) -> AsyncIterator[AudioFrame]:
         while True:
-            frame = await self._frames.get()
+            try:
+                frame = self._frames.popleft()
+            except IndexError:
+                self._frame_ready.clear()
+                await self._frame_ready.wait()
+                continue
             if frame is None:
                 break
             yield frame
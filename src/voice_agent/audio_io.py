@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 import asyncio
-import time
-from typing import AsyncIterator, Optional
+from collections import deque
+from typing import AsyncIterator, Optional, Union
 
 from .audio import AudioFrame, AudioFrontend
 
@@ -16,6 +16,13 @@ class MicUnavailable(Exception):
     pass
 
 
+AudioChunk = Union[bytes, memoryview]
+
+# Ring capacity in frames; at 30 ms frames this is ~6 s of backlog before
+# the oldest frames are dropped.
+_RING_CAPACITY = 200
+
+
 class SoundDeviceMic:
     def __init__(self, sample_rate: int, chunk_ms: int, channels: int = 1, dtype: str = "int16") -> None:
         if sd is None:
@@ -25,9 +32,14 @@ class SoundDeviceMic:
         self.channels = channels
         self.dtype = dtype
         self.blocksize = int(sample_rate * chunk_ms / 1000)
-        self._queue: asyncio.Queue[Optional[bytes]] = asyncio.Queue()
+        # SPSC ring: the PortAudio thread appends, the event loop pops.
+        # deque(maxlen=...) gives drop-oldest on overflow without a branch.
+        self._ring: deque[Optional[AudioChunk]] = deque(maxlen=_RING_CAPACITY)
+        self._data_ready = asyncio.Event()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
         self._stream: Optional[sd.RawInputStream] = None
         self._running = False
+        self.dropped_frames = 0
 
     async def __aenter__(self) -> "SoundDeviceMic":
         self._start_stream()
@@ -43,14 +55,18 @@ class SoundDeviceMic:
             pass
         if not self._running:
             return
-        try:
-            self._queue.put_nowait(bytes(indata))
-        except asyncio.QueueFull:
-            pass
+        # PortAudio reuses indata after the callback returns, so one owned
+        # copy per frame is required
+        if len(self._ring) == self._ring.maxlen:
+            self.dropped_frames += 1
+        self._ring.append(bytes(memoryview(indata).cast("B")))
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._data_ready.set)
 
     def _start_stream(self) -> None:
         if self._stream is not None:
             return
+        self._loop = asyncio.get_running_loop()
         self._running = True
         self._stream = sd.RawInputStream(
             samplerate=self.sample_rate,
@@ -69,14 +85,20 @@ class SoundDeviceMic:
             finally:
                 self._stream.close()
         self._stream = None
-        await self._queue.put(None)
+        self._ring.append(None)
+        self._data_ready.set()
 
-    async def frames(self) -> asyncio.Queue:
-        return self._queue
+    async def _next_chunk(self) -> Optional[AudioChunk]:
+        while True:
+            try:
+                return self._ring.popleft()
+            except IndexError:
+                self._data_ready.clear()
+                await self._data_ready.wait()
 
     async def forward_to(self, frontend: AudioFrontend) -> None:
         while True:
-            data = await self._queue.get()
+            data = await self._next_chunk()
             if data is None:
                 await frontend.end_utterance()
                 break
@@ -84,11 +106,13 @@ class SoundDeviceMic:
 
     async def stream_frames(self) -> AsyncIterator[AudioFrame]:
         self._start_stream()
+        frame_index = 0
         while True:
-            data = await self._queue.get()
+            data = await self._next_chunk()
             if data is None:
                 break
-            yield AudioFrame(timestamp=time.time(), data=data)
+            yield AudioFrame(timestamp=frame_index * self.chunk_ms / 1000, data=data)
+            frame_index += 1
 
 
 class SoundDeviceSpeaker:
@@ -111,11 +135,12 @@ class SoundDeviceSpeaker:
             self._stream.start()
 
     async def play_chunk(self, data: bytes, is_final: bool = False) -> None:
-        self._ensure_stream()
-        assert self._stream is not None
-        self._stream.write(data)
-        if is_final:
-            await asyncio.sleep(0)
+        del is_final
+        if self._stream is None:
+            self._ensure_stream()
+        # The device write blocks for the chunk duration; run it off the
+        # event loop so playback pacing does not stall other tasks.
+        await asyncio.to_thread(self._stream.write, data)
 
     async def close(self) -> None:
         if self._stream is not None:
@@ -33,40 +33,62 @@ class BufferedAudioPlayer:
         self.max_buffer_ms = max_buffer_ms
         self.playback_callback = playback_callback
 
-        self._queue: deque[bytes] = deque()
+        # Single-producer/single-consumer: deque ops are atomic under the
+        # GIL, so no lock is needed around individual append/popleft calls.
+        self._queue: "deque[bytes | memoryview]" = deque()
         self._playing = False
         self._task: Optional[asyncio.Task[None]] = None
-        self._lock = asyncio.Lock()
         self._cancelled = False
+        self._finishing = False
+        self._callback_is_async: Optional[bool] = None
+        self._chunk_ready = asyncio.Event()
+        self._drained = asyncio.Event()
+        self._new_stream = asyncio.Event()
 
     async def start_stream(self) -> None:
-        """Start a new audio stream."""
-        await self.stop()
-        async with self._lock:
-            self._queue.clear()
-            self._playing = True
-            self._cancelled = False
+        """Start a new audio stream, reusing the playback loop when alive."""
+        self._queue.clear()
+        self._playing = True
+        self._cancelled = False
+        self._finishing = False
+        self._callback_is_async = None
+        self._chunk_ready.clear()
+        self._drained.clear()
+        if self._task is None or self._task.done():
             self._task = asyncio.create_task(self._playback_loop())
+        self._new_stream.set()
+
+    async def add_chunk(self, audio_chunk: "bytes | memoryview") -> None:
+        """Add an audio chunk to the playback queue.
 
-    async def add_chunk(self, audio_chunk: bytes) -> None:
-        """Add an audio chunk to the playback queue."""
+        Chunks are queued and handed to the playback callback untouched, so
+        any bytes-like object works and memoryviews pass through zero-copy.
+        """
         if self._playing and not self._cancelled:
-            async with self._lock:
-                self._queue.append(audio_chunk)
+            self._queue.append(audio_chunk)
+            self._chunk_ready.set()
 
     async def finish_stream(self) -> None:
-        """Signal that no more chunks will be added and wait for playback to complete."""
-        # Wait for queue to drain
-        while self._playing and len(self._queue) > 0 and not self._cancelled:
-            await asyncio.sleep(0.01)
-        await self.stop()
+        """Signal that no more chunks will be added and wait for playback to complete.
+
+        The playback loop stays parked for the next stream instead of being
+        torn down, so back-to-back streams skip a task cancel/create cycle.
+        """
+        self._finishing = True
+        # Wake the loop so it can observe the finishing flag
+        self._chunk_ready.set()
+        if self._playing and not self._cancelled:
+            await self._drained.wait()
+        self._playing = False
 
     async def stop(self) -> None:
-        """Stop playback immediately and clear the queue."""
+        """Stop playback immediately, clear the queue, and tear down the loop."""
         self._cancelled = True
-        async with self._lock:
-            self._playing = False
-            self._queue.clear()
+        self._playing = False
+        self._queue.clear()
+        # Release anyone blocked in finish_stream or the playback loop
+        self._chunk_ready.set()
+        self._drained.set()
 
         if self._task and not self._task.done():
             self._task.cancel()
@@ -80,40 +102,71 @@ class BufferedAudioPlayer:
         """Check if audio is currently playing."""
         return self._playing and self._task is not None and not self._task.done()
 
+    def is_active(self) -> bool:
+        """True while a stream is open or audio is queued.
+
+        A playback loop parked between streams does not count: it is idle
+        by design and stopping it would defeat its reuse, so callers can
+        treat a parked player as inactive.
+        """
+        return self._playing or bool(self._queue)
+
     async def _playback_loop(self) -> None:
-        """Main playback loop that handles buffering and pacing."""
-        # Wait for minimum buffer
+        """Plays one stream at a time, parking between streams."""
+        while True:
+            await self._new_stream.wait()
+            self._new_stream.clear()
+            try:
+                await self._play_stream()
+            except asyncio.CancelledError:
+                self._drained.set()
+                raise
+            except Exception:
+                # A failing playback callback aborts the stream rather than
+                # crashing callers awaiting finish_stream
+                pass
+            self._playing = False
+            self._drained.set()
+
+    async def _play_stream(self) -> None:
+        """Buffer then drain a single stream's chunks."""
+        # Wait for minimum buffer, waking only when chunks arrive
         buffer_start = time.perf_counter()
-        while self._playing and not self._cancelled:
+        while self._playing and not self._cancelled and not self._finishing:
             buffer_duration = (time.perf_counter() - buffer_start) * 1000
             if buffer_duration >= self.min_buffer_ms or len(self._queue) > 5:
                 break
-            await asyncio.sleep(0.01)
+            remaining = (self.min_buffer_ms - buffer_duration) / 1000
+            self._chunk_ready.clear()
+            try:
+                await asyncio.wait_for(self._chunk_ready.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                break
 
         # Play buffered chunks
         while self._playing and not self._cancelled:
-            async with self._lock:
-                if not self._queue:
-                    # Queue is empty, check if we should stop
-                    if not self._playing:
-                        break
-                    # Otherwise wait for more data
-                    await asyncio.sleep(0.01)
-                    continue
-
+            try:
                 chunk = self._queue.popleft()
+            except IndexError:
+                if self._finishing:
+                    break
+                chunk = None
+
+            if chunk is None:
+                # Wait for more data; add_chunk/finish_stream/stop wake us
+                self._chunk_ready.clear()
+                if self._queue or self._finishing or self._cancelled:
+                    continue
+                await self._chunk_ready.wait()
+                continue
 
-            # Play the chunk
+            # Play the chunk; pacing comes from the blocking device write
             if self.playback_callback and chunk:
-                try:
-                    result = self.playback_callback(chunk)
-                    if asyncio.iscoroutine(result) or asyncio.isfuture(result):
-                        await result
-                except Exception:
-                    # Ignore playback errors to prevent crashes
-                    pass
-
-            # Small delay to prevent CPU spinning
-            await asyncio.sleep(0.001)
-
-        self._playing = False
+                result = self.playback_callback(chunk)
+                if self._callback_is_async is None:
+                    # The callback's return type is fixed for the life of
+                    # the stream; classify it once instead of probing
+                    # every chunk.
+                    self._callback_is_async = asyncio.iscoroutine(result) or asyncio.isfuture(result)
+                if self._callback_is_async and result is not None:
+                    await result
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import asyncio
+from typing import AsyncIterator, Iterable, List, Optional, Tuple
+
+from .llm import ChatMessage, LLMClient
+
+# Collection window and batch bound for coalescing concurrent prompts
+_MAX_WAIT_MS = 20
+_MAX_BATCH = 8
+
+
+class BatchLLMClient(LLMClient):
+    """Coalesces concurrent chat() calls into batched bursts.
+
+    Prompts arriving within a short window are collected and dispatched
+    together, so N concurrent sub-agents cost one dispatch cycle instead of
+    N independently scheduled calls. The providers in this tree accept one
+    prompt per HTTP request, so a batch is issued as a single concurrent
+    burst over the client's shared connection pool; a provider with a true
+    batch endpoint can override _dispatch to send one request.
+
+    Batching is opt-in: nothing in this tree wraps a client by default,
+    because the sub-agent paths stream via complete(), which bypasses the
+    batcher. Wrap a client with this only where concurrent non-streaming
+    chat() bursts actually occur.
+    """
+
+    def __init__(self, base: LLMClient, max_wait_ms: int = _MAX_WAIT_MS, batch_size: int = _MAX_BATCH) -> None:
+        self._base = base
+        self._max_wait = max_wait_ms / 1000
+        self._batch_size = batch_size
+        self._pending: List[Tuple[List[ChatMessage], "asyncio.Future[str]"]] = []
+        self._arrived = asyncio.Event()
+        self._collector: Optional[asyncio.Task[None]] = None
+
+    async def complete(self, messages: Iterable[ChatMessage]) -> AsyncIterator[str]:
+        # Streaming responses are latency-sensitive and per-consumer; they
+        # bypass the batcher entirely.
+        async for chunk in self._base.complete(messages):
+            yield chunk
+
+    async def chat(self, messages: Iterable[ChatMessage]) -> str:
+        return await self.submit(messages)
+
+    async def submit(self, messages: Iterable[ChatMessage]) -> str:
+        """Queue one prompt and wait for its response from the next batch."""
+        future: "asyncio.Future[str]" = asyncio.get_running_loop().create_future()
+        self._pending.append((list(messages), future))
+        self._arrived.set()
+        if self._collector is None or self._collector.done():
+            self._collector = asyncio.create_task(self._collect())
+        return await future
+
+    async def _collect(self) -> None:
+        loop = asyncio.get_running_loop()
+        while self._pending:
+            # Hold the window open until it expires or the batch fills
+            deadline = loop.time() + self._max_wait
+            while len(self._pending) < self._batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                self._arrived.clear()
+                try:
+                    await asyncio.wait_for(self._arrived.wait(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    break
+            batch = self._pending[: self._batch_size]
+            del self._pending[: self._batch_size]
+            await self._dispatch(batch)
+
+    async def _dispatch(self, batch: List[Tuple[List[ChatMessage], "asyncio.Future[str]"]]) -> None:
+        responses = await asyncio.gather(
+            *(self._base.chat(messages) for messages, _ in batch),
+            return_exceptions=True,
+        )
+        for (_, future), response in zip(batch, responses):
+            if future.cancelled():
+                continue
+            if isinstance(response, BaseException):
+                future.set_exception(response)
+            else:
+                future.set_result(response)
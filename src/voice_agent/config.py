@@ -70,6 +70,17 @@ class IdleConfig:
     suspend_prompt: str = "Going idle. Say the wake word to resume."
 
 
+_cached_config: Optional["AgentConfig"] = None
+_prepared_session_dirs: set[Path] = set()
+
+
+def _ensure_session_dir(path: Path) -> None:
+    parent = path.parent
+    if parent not in _prepared_session_dirs:
+        parent.mkdir(parents=True, exist_ok=True)
+        _prepared_session_dirs.add(parent)
+
+
 @dataclass
 class AgentConfig:
     audio: AudioConfig
@@ -83,7 +94,16 @@ class AgentConfig:
     wake: WakeConfig
 
     @classmethod
-    def from_env(cls) -> "AgentConfig":
+    def from_env(cls, refresh: bool = False) -> "AgentConfig":
+        """Build a config from environment variables.
+
+        The parsed config is cached per process since the environment does
+        not change between calls; pass refresh=True to re-read it.
+        """
+        global _cached_config
+        if _cached_config is not None and not refresh:
+            return _cached_config
+
         audio = AudioConfig(
             wake_word=os.getenv("VA_WAKE_WORD", AudioConfig.wake_word),
             sample_rate=int(os.getenv("VA_SAMPLE_RATE", AudioConfig.sample_rate)),
@@ -139,9 +159,9 @@ class AgentConfig:
             consecutive=int(os.getenv("VA_WAKE_CONSECUTIVE", WakeConfig.consecutive)),
         )
 
-        sessions.storage_path.parent.mkdir(parents=True, exist_ok=True)
+        _ensure_session_dir(sessions.storage_path)
 
-        return cls(
+        _cached_config = cls(
             audio=audio,
             stt=stt,
             tts=tts,
@@ -152,3 +172,4 @@ class AgentConfig:
             vad=vad,
             wake=wake,
         )
+        return _cached_config
@@ -1,16 +1,40 @@
 from __future__ import annotations
 
-import uuid
+import asyncio
+import io
+import itertools
+import time
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Awaitable, Callable, List, Optional
 
 from .config import AgentConfig
 from .llm import ChatMessage, LLMClient
+from .semantic_cache import SemanticCache
 from .session_store import SessionStore
 from .tool_parser import ToolParser, ToolRequest
 from .tool_runner import ToolResult, ToolRunner
 
 
+# Static system prompts, hoisted so the prefix sent to the provider is
+# byte-identical across turns (a requirement for provider prompt caching).
+# Session ids only key JSON lines in the store; a timestamp plus process
+# counter is unique enough and skips the urandom read uuid4 pays on boot.
+_SESSION_COUNTER = itertools.count()
+
+SYSTEM_DIALOG = (
+    "You are a natural, concise voice agent that can run tools silently and report summaries.\n"
+    "If tools were run, summarize their outcome briefly."
+)
+SYSTEM_SUMMARY = "Keep summaries under 40 words."
+SYSTEM_BACKGROUND = "Summarize background tool completion concisely."
+
+# The summary/background prompts have no per-instance parts, so the frozen
+# ChatMessage objects are module constants; the dialog system message stays
+# per-instance because it depends on smart_tools.
+_SUMMARY_SYSTEM_MSG = ChatMessage(role="system", content=SYSTEM_SUMMARY, cache=True)
+_BACKGROUND_SYSTEM_MSG = ChatMessage(role="system", content=SYSTEM_BACKGROUND, cache=True)
+
+
 @dataclass
 class DialogTurn:
     user_text: str
@@ -32,151 +56,289 @@ class DialogManager:
         self.llm = llm
         self.tool_runner = tool_runner
         self.session_store = session_store
-        self.session_id = str(uuid.uuid4())
+        self.session_id = f"{time.time_ns():x}-{next(_SESSION_COUNTER):x}"
         self.smart_tools = smart_tools  # Enable LLM-driven tool execution
+        # The system prompt is invariant for the session; build it (and its
+        # ChatMessage, which is frozen) once instead of per turn. cache=True
+        # lets providers reuse their prompt-cache for the static prefix; tool
+        # outputs and user text always come after it.
+        context_parts = [SYSTEM_DIALOG]
+        if smart_tools:
+            context_parts.append(ToolParser.get_tool_system_prompt())
+        self._system_msg = ChatMessage(role="system", content="\n".join(context_parts), cache=True)
+        # Near-duplicate summary/background prompts reuse cached responses
+        self._response_cache = SemanticCache(
+            path=config.sessions.storage_path.with_name("llm_cache.jsonl"),
+        )
+        # Legacy explicit command mode: dispatch on the first word instead of
+        # scanning the text once per prefix. Exactly one handler can match a
+        # turn, so overlapping prefixes can never double-fire. Handlers that
+        # resolve the whole turn (runbg) return a DialogTurn; the rest append
+        # tool results and fall through to the LLM.
+        self._prefix_handlers = {
+            "run": self._handle_run_command,
+            "runbg": self._handle_runbg_command,
+            "web": self._handle_web_command,
+            "ssh": self._handle_ssh_command,
+            "serial": self._handle_serial_command,
+        }
+        # Summaries recorded off the critical path; kept here so tasks are
+        # not garbage-collected mid-flight and can be awaited at shutdown.
+        self._summary_tasks: set[asyncio.Task] = set()
+        # Signalled when a background tool result is ready; the voice loop
+        # parks on this instead of polling on a timer
+        self.background_event = asyncio.Event()
+        tool_runner.result_event = self.background_event
 
-    async def handle_user_text(self, text: str) -> DialogTurn:
-        tool_results: List[ToolResult] = []
-
-        # Legacy explicit command mode
-        if text.startswith("runbg "):
-            command = text[len("runbg ") :].strip()
-            task_id = self.tool_runner.submit_background(command)
-            response_text = f"Started background task {task_id} for: {command}"
-            summary = await self._summarize(text, response_text, tool_results)
-            self._record(text, response_text, tool_results, summary)
-            return DialogTurn(user_text=text, response_text=response_text, tool_results=tool_results, summary=summary)
-
-        if text.startswith("run "):
-            command = text[len("run ") :].strip()
-            result = await self.tool_runner.run_command(command)
-            result.task_id = result.task_id or "foreground"
-            tool_results.append(result)
+    async def handle_user_text(
+        self,
+        text: str,
+        on_response_chunk: Optional[Callable[[str], Awaitable[None]]] = None,
+    ) -> DialogTurn:
+        """Handle one user turn.
 
-        if text.startswith("web "):
-            url = text[len("web ") :].strip()
-            result = await self.tool_runner.fetch_url(url)
-            result.task_id = result.task_id or "web"
-            tool_results.append(result)
+        When on_response_chunk is given, speech text is delivered to it
+        incrementally as the LLM streams, so TTS can start before the full
+        response (and its tool parsing) has finished.
+        """
+        tool_results: List[ToolResult] = []
 
-        if text.startswith("ssh "):
-            parts = text.split(maxsplit=2)
-            if len(parts) >= 3:
-                host = parts[1]
-                command = parts[2]
-                result = await self.tool_runner.run_ssh(host, command)
-                result.task_id = result.task_id or "ssh"
-                tool_results.append(result)
-
-        if text.startswith("serial "):
-            parts = text.split(maxsplit=2)
-            if len(parts) >= 3:
-                port = parts[1]
-                payload = parts[2]
-                result = await self.tool_runner.run_serial(port, payload)
-                result.task_id = result.task_id or "serial"
-                tool_results.append(result)
+        head, _, rest = text.partition(" ")
+        handler = self._prefix_handlers.get(head)
+        if handler is not None and rest:
+            early_turn = await handler(text, rest.strip(), tool_results)
+            if early_turn is not None:
+                return early_turn
 
         # Get LLM response (may include tool requests if smart_tools enabled)
-        response_text = await self._llm_response(text, tool_results)
+        response_text, streamed_text = await self._llm_response(text, tool_results, on_response_chunk)
 
         # Parse and execute tool requests from LLM response if smart_tools enabled
         if self.smart_tools:
             parsed = ToolParser.parse_response(response_text)
             response_text = parsed.speech_text
 
-            # Execute requested tools
+            # Execute requested tools; foreground requests are independent,
+            # so run them concurrently and wait for the slowest rather than
+            # paying each latency in sequence.
+            pending = []
             for tool_req in parsed.tool_requests:
                 if tool_req.silent:
                     # Execute in background
-                    task_id = await self._execute_tool_request_background(tool_req)
+                    await self._execute_tool_request_background(tool_req)
                 else:
-                    # Execute immediately and wait
-                    result = await self._execute_tool_request_foreground(tool_req)
+                    pending.append(self._execute_tool_request_foreground(tool_req))
+            if pending:
+                for result in await asyncio.gather(*pending):
                     if result:
                         tool_results.append(result)
 
-        summary = await self._summarize(text, response_text, tool_results)
-        self._record(text, response_text, tool_results, summary)
+        # Flush any speech text withheld while waiting for tool-tag parsing.
+        # Streaming always stops at the first tool marker, so what was
+        # spoken is a prefix of the parsed speech text modulo the leading
+        # whitespace that parsing strips; align on the text itself rather
+        # than raw offsets, which drift once tags are removed.
+        if on_response_chunk is not None:
+            spoken = streamed_text.lstrip()
+            if response_text.startswith(spoken):
+                remainder = response_text[len(spoken):]
+            elif spoken.startswith(response_text):
+                # Everything except trailing whitespace was already spoken
+                remainder = ""
+            else:  # pragma: no cover - stream and parse disagreeing
+                remainder = response_text
+            if remainder:
+                await on_response_chunk(remainder)
+
+        tool_payloads, tool_note = self._materialise_tool_results(tool_results)
+        self.session_store.record_turn(self.session_id, text, response_text, tool_payloads)
+        # The summary feeds the session store, not the spoken reply, so it
+        # runs concurrently with whatever the caller does next instead of
+        # adding a second LLM round trip to the turn.
+        self._spawn_summary(text, response_text, tool_note)
+        return DialogTurn(user_text=text, response_text=response_text, tool_results=tool_results, summary=None)
+
+    def _spawn_summary(self, user_text: str, response_text: str, tool_note: str) -> None:
+        task = asyncio.create_task(self._record_summary(user_text, response_text, tool_note))
+        self._summary_tasks.add(task)
+        task.add_done_callback(self._summary_tasks.discard)
+
+    async def _record_summary(self, user_text: str, response_text: str, tool_note: str) -> None:
+        summary = await self._summarize(user_text, response_text, tool_note)
+        if summary:
+            self.session_store.record_summary(self.session_id, summary)
+
+    async def wait_for_summaries(self) -> None:
+        """Wait for in-flight background summaries; call before shutdown."""
+        if self._summary_tasks:
+            await asyncio.gather(*list(self._summary_tasks), return_exceptions=True)
+
+    async def _handle_runbg_command(self, text: str, command: str, tool_results: List[ToolResult]) -> Optional[DialogTurn]:
+        task_id = self.tool_runner.submit_background(command)
+        response_text = f"Started background task {task_id} for: {command}"
+        summary = await self._summarize(text, response_text, "")
+        self._record(text, response_text, [], summary)
         return DialogTurn(user_text=text, response_text=response_text, tool_results=tool_results, summary=summary)
 
+    async def _handle_run_command(self, text: str, command: str, tool_results: List[ToolResult]) -> Optional[DialogTurn]:
+        result = await self.tool_runner.run_command(command)
+        result.task_id = result.task_id or "foreground"
+        tool_results.append(result)
+        return None
+
+    async def _handle_web_command(self, text: str, url: str, tool_results: List[ToolResult]) -> Optional[DialogTurn]:
+        result = await self.tool_runner.fetch_url(url)
+        result.task_id = result.task_id or "web"
+        tool_results.append(result)
+        return None
+
+    async def _handle_ssh_command(self, text: str, rest: str, tool_results: List[ToolResult]) -> Optional[DialogTurn]:
+        host, _, command = rest.partition(" ")
+        if host and command:
+            result = await self.tool_runner.run_ssh(host, command)
+            result.task_id = result.task_id or "ssh"
+            tool_results.append(result)
+        return None
+
+    async def _handle_serial_command(self, text: str, rest: str, tool_results: List[ToolResult]) -> Optional[DialogTurn]:
+        port, _, payload = rest.partition(" ")
+        if port and payload:
+            result = await self.tool_runner.run_serial(port, payload)
+            result.task_id = result.task_id or "serial"
+            tool_results.append(result)
+        return None
+
     async def poll_background(self) -> List[DialogTurn]:
-        turns: List[DialogTurn] = []
-        while True:
-            result = await self.tool_runner.next_result(timeout=0)
-            if result is None:
-                break
-            text = f"[background task {result.task_id} complete]"
-            tool_results = [result]
-            response_text = await self._background_response(result)
-            summary = await self._summarize(text, response_text, tool_results)
-            self._record(text, response_text, tool_results, summary)
-            turns.append(DialogTurn(user_text=text, response_text=response_text, tool_results=tool_results, summary=summary))
-        return turns
-
-    async def _llm_response(self, text: str, tool_results: List[ToolResult]) -> str:
-        # Base system context
-        context_parts = [
-            "You are a natural, concise voice agent that can run tools silently and report summaries.",
-            "If tools were run, summarize their outcome briefly.",
-        ]
+        results = self.tool_runner.drain_results()
+        if not results:
+            return []
+        # The per-result LLM calls are independent, so run them concurrently.
+        return list(await asyncio.gather(*(self._background_turn(result) for result in results)))
 
-        # Add tool instructions if smart_tools enabled
-        if self.smart_tools:
-            context_parts.append(ToolParser.get_tool_system_prompt())
+    async def _background_turn(self, result: ToolResult) -> DialogTurn:
+        text = f"[background task {result.task_id} complete]"
+        tool_results = [result]
+        response_text = await self._background_response(result)
+        tool_payloads, tool_note = self._materialise_tool_results(tool_results)
+        summary = await self._summarize(text, response_text, tool_note)
+        self._record(text, response_text, tool_payloads, summary)
+        return DialogTurn(user_text=text, response_text=response_text, tool_results=tool_results, summary=summary)
 
-        context = "\n".join(context_parts)
+    # Markers that start a tool request inside a streamed response; speech
+    # text is withheld from the marker (or a possible partial marker at the
+    # stream tail) until parsing resolves it.
+    _TOOL_MARKERS = ("<tool", "```tool")
+    _MARKER_HOLDBACK = max(len(marker) for marker in _TOOL_MARKERS) - 1
 
+    @classmethod
+    def _safe_speech_end(cls, raw: str) -> int:
+        cut = len(raw)
+        for marker in cls._TOOL_MARKERS:
+            idx = raw.find(marker)
+            if idx != -1 and idx < cut:
+                cut = idx
+        if cut == len(raw):
+            cut = max(0, cut - cls._MARKER_HOLDBACK)
+        return cut
+
+    async def _llm_response(
+        self,
+        text: str,
+        tool_results: List[ToolResult],
+        on_chunk: Optional[Callable[[str], Awaitable[None]]] = None,
+    ) -> tuple[str, str]:
         tool_summary = " \n".join(
             f"tool {res.task_id} exit {res.returncode}: {res.stdout[:200]}" for res in tool_results
         )
 
         messages = [
-            ChatMessage(role="system", content=context),
+            self._system_msg,
             ChatMessage(role="user", content=text),
         ]
         if tool_summary:
             messages.append(ChatMessage(role="assistant", content=f"Tools: {tool_summary}"))
 
-        parts: List[str] = []
+        # StringIO accumulation avoids one interim str per chunk, and the
+        # marker scan runs only over the unemitted tail instead of the whole
+        # response so far. The emitted text itself is returned so the caller
+        # can align the post-parse flush against exactly what was spoken.
+        buf = io.StringIO()
+        spoken = io.StringIO()
+        pending = ""
         async for chunk in self.llm.complete(messages):
-            parts.append(chunk)
-        return "".join(parts).strip()
+            buf.write(chunk)
+            if on_chunk is None:
+                continue
+            pending += chunk
+            safe_end = self._safe_speech_end(pending) if self.smart_tools else len(pending)
+            if safe_end > 0:
+                await on_chunk(pending[:safe_end])
+                spoken.write(pending[:safe_end])
+                pending = pending[safe_end:]
+        return buf.getvalue().strip(), spoken.getvalue()
 
     async def _background_response(self, result: ToolResult) -> str:
         prompt = f"Background task {result.task_id} finished with code {result.returncode}. Output: {result.stdout[:300]}"
+        cached = self._response_cache.get(prompt)
+        if cached is not None:
+            return cached
         messages = [
-            ChatMessage(role="system", content="Summarize background tool completion concisely."),
+            _BACKGROUND_SYSTEM_MSG,
             ChatMessage(role="user", content=prompt),
         ]
-        return await self.llm.chat(messages)
+        response = await self.llm.chat(messages)
+        if response:
+            self._response_cache.put(prompt, response)
+        return response
+
+    # Responses under this many words are already their own summary when no
+    # tools ran; skip the LLM round trip and store the response directly.
+    _TRIVIAL_RESPONSE_WORDS = 25
 
-    async def _summarize(self, user_text: str, response_text: str, tool_results: List[ToolResult]) -> Optional[str]:
-        summary_prompt = "Summarize this exchange for memory: " + user_text + " | " + response_text
-        tool_note = "; ".join(f"task {res.task_id} exit {res.returncode}" for res in tool_results)
+    async def _summarize(self, user_text: str, response_text: str, tool_note: str) -> Optional[str]:
+        if not tool_note and len(response_text.split()) < self._TRIVIAL_RESPONSE_WORDS:
+            return response_text[:200]
+
+        prompt_parts = ["Summarize this exchange for memory: ", user_text, " | ", response_text]
         if tool_note:
-            summary_prompt += " | tools: " + tool_note
+            prompt_parts += [" | tools: ", tool_note]
+        summary_prompt = "".join(prompt_parts)
+
+        cached = self._response_cache.get(summary_prompt)
+        if cached is not None:
+            return cached
 
         messages = [
-            ChatMessage(role="system", content="Keep summaries under 40 words."),
+            _SUMMARY_SYSTEM_MSG,
             ChatMessage(role="user", content=summary_prompt),
         ]
         summary = await self.llm.chat(messages)
-        return summary.strip() if summary else None
-
-    def _record(self, user_text: str, response_text: str, tool_results: List[ToolResult], summary: Optional[str]) -> None:
-        tool_payloads = [
-            {
-                "task_id": res.task_id,
-                "command": res.command,
-                "returncode": res.returncode,
-                "stdout": res.stdout,
-                "stderr": res.stderr,
-                "duration": res.duration,
-                "timed_out": res.timed_out,
-            }
-            for res in tool_results
-        ]
+        summary = summary.strip() if summary else None
+        if summary:
+            self._response_cache.put(summary_prompt, summary)
+        return summary
+
+    @staticmethod
+    def _materialise_tool_results(tool_results: List[ToolResult]) -> tuple[List[dict], str]:
+        """Build the persisted payloads and the summary note in one pass."""
+        payloads: List[dict] = []
+        notes: List[str] = []
+        for res in tool_results:
+            payloads.append(
+                {
+                    "task_id": res.task_id,
+                    "command": res.command,
+                    "returncode": res.returncode,
+                    "stdout": res.stdout,
+                    "stderr": res.stderr,
+                    "duration": res.duration,
+                    "timed_out": res.timed_out,
+                }
+            )
+            notes.append(f"task {res.task_id} exit {res.returncode}")
+        return payloads, "; ".join(notes)
+
+    def _record(self, user_text: str, response_text: str, tool_payloads: List[dict], summary: Optional[str]) -> None:
         self.session_store.record_turn(self.session_id, user_text, response_text, tool_payloads)
         if summary:
             self.session_store.record_summary(self.session_id, summary)
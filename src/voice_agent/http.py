@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from typing import Optional
+
+import httpx
+
+# Pool sized for concurrent TTS/STT/tool fetches from one agent process
+_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Shared lazily-created AsyncClient.
+
+    TCP/TLS setup is amortized across every caller instead of being paid
+    per request; callers pass per-request timeouts where the default does
+    not fit.
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(timeout=60, limits=_LIMITS)
+    return _client
+
+
+async def aclose_client() -> None:
+    """Close the shared client; call once at application shutdown."""
+    global _client
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+    _client = None
@@ -26,6 +26,7 @@ class IdleManager:
         self._last_active = time.monotonic()
         self._asked = False
         self._suspended = False
+        self._touched = asyncio.Event()
 
     async def start(self) -> None:
         if self._running:
@@ -50,12 +51,36 @@ class IdleManager:
         self._last_active = time.monotonic()
         self._asked = False
         self._suspended = False
+        self._touched.set()
+
+    def _next_deadline(self) -> Optional[float]:
+        if not self._asked:
+            return self.ask_after_seconds
+        if not self._suspended:
+            return self.suspend_after_seconds
+        return None
 
     async def _loop(self) -> None:
+        # Sleep exactly until the next deadline instead of polling every
+        # second; touch() interrupts the wait and resets the deadlines.
         while self._running:
-            now = time.monotonic()
-            idle_for = now - self._last_active
+            deadline = self._next_deadline()
+            if deadline is None:
+                # Both prompts have fired; nothing to do until activity
+                await self._touched.wait()
+                self._touched.clear()
+                continue
+
+            wait = deadline - (time.monotonic() - self._last_active)
+            if wait > 0:
+                try:
+                    await asyncio.wait_for(self._touched.wait(), timeout=wait)
+                    self._touched.clear()
+                    continue
+                except asyncio.TimeoutError:
+                    pass
 
+            idle_for = time.monotonic() - self._last_active
             if not self._asked and idle_for >= self.ask_after_seconds:
                 self._asked = True
                 await self.speak(self.idle_prompt)
@@ -66,5 +91,3 @@ class IdleManager:
                     await self.speak(self.suspend_prompt)
                 if self.on_suspend:
                     await self.on_suspend()
-
-            await asyncio.sleep(1)
@@ -1,16 +1,66 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import io
+import json
 from dataclasses import dataclass
-from typing import AsyncIterator, Iterable, List
+from pathlib import Path
+from typing import AsyncIterator, Dict, Iterable, List, Optional
 
 import httpx
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 
-@dataclass
+# Fast path for the per-SSE-line parse; orjson is 2-5x quicker when present
+_loads = orjson.loads if orjson is not None else json.loads
+_JSONDecodeErrors = (json.JSONDecodeError,) if orjson is None else (json.JSONDecodeError, orjson.JSONDecodeError)
+
+# SSE data lines past this size are dropped rather than parsed, so a
+# misbehaving stream cannot balloon memory.
+_SSE_LINE_LIMIT = 64_000
+
+# Exact-match chat cache location and write-batch size
+_CHAT_CACHE_PATH = Path("data/llm_cache.json")
+_CHAT_CACHE_FLUSH_EVERY = 16
+
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=4)
+
+__all__ = [
+    "ChatMessage",
+    "LLMClient",
+    "CachedChatMixin",
+    "MinimaxStubClient",
+    "MinimaxClient",
+    "OpenRouterClient",
+]
+
+
+@dataclass(frozen=True)
 class ChatMessage:
     role: str
     content: str
+    # Mark static prefix messages so providers with prompt caching can skip
+    # reprocessing them each turn
+    cache: bool = False
+
+
+def _encode_message(message: ChatMessage) -> dict:
+    if message.cache:
+        return {
+            "role": message.role,
+            "content": [
+                {
+                    "type": "text",
+                    "text": message.content,
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ],
+        }
+    return {"role": message.role, "content": message.content}
 
 
 class LLMClient:
@@ -18,10 +68,69 @@ class LLMClient:
         raise NotImplementedError
 
 
-class MinimaxStubClient(LLMClient):
+class CachedChatMixin:
+    """Exact-match completion cache for chat().
+
+    Responses are keyed by a stable hash of the canonicalized message list,
+    so byte-identical prompts (re-issued commands, reruns) return instantly
+    without an HTTP round trip. The cache is persisted as a JSON dict and
+    flushed in batches.
+    """
+
+    def _init_chat_cache(self, path: Optional[Path] = None) -> None:
+        self._chat_cache_path = path or _CHAT_CACHE_PATH
+        self._chat_cache: Dict[str, str] = {}
+        self._chat_cache_dirty = 0
+        if self._chat_cache_path.exists():
+            try:
+                self._chat_cache = json.loads(self._chat_cache_path.read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError):
+                self._chat_cache = {}
+
+    @staticmethod
+    def _chat_cache_key(messages: List[ChatMessage]) -> str:
+        canonical = json.dumps([(m.role, m.content) for m in messages], ensure_ascii=False)
+        return hashlib.blake2b(canonical.encode(), digest_size=16).hexdigest()
+
+    def _chat_cache_store(self, key: str, response: str) -> None:
+        self._chat_cache[key] = response
+        self._chat_cache_dirty += 1
+        if self._chat_cache_dirty >= _CHAT_CACHE_FLUSH_EVERY:
+            self.flush_chat_cache()
+
+    def flush_chat_cache(self) -> None:
+        if not self._chat_cache_dirty:
+            return
+        try:
+            self._chat_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self._chat_cache_path.write_text(
+                json.dumps(self._chat_cache, ensure_ascii=False), encoding="utf-8"
+            )
+            self._chat_cache_dirty = 0
+        except OSError:
+            pass
+
+    async def chat(self, messages: Iterable[ChatMessage]) -> str:
+        """Get the full response as a string, consulting the exact cache first."""
+        msgs = list(messages)
+        key = self._chat_cache_key(msgs)
+        cached = self._chat_cache.get(key)
+        if cached is not None:
+            return cached
+        buf = io.StringIO()
+        async for chunk in self.complete(msgs):
+            buf.write(chunk)
+        response = buf.getvalue()
+        if response:
+            self._chat_cache_store(key, response)
+        return response
+
+
+class MinimaxStubClient(CachedChatMixin, LLMClient):
     def __init__(self, model: str, max_tokens: int) -> None:
         self.model = model
         self.max_tokens = max_tokens
+        self._init_chat_cache()
 
     async def complete(self, messages: Iterable[ChatMessage]) -> AsyncIterator[str]:
         msgs: List[ChatMessage] = list(messages)
@@ -29,14 +138,8 @@ class MinimaxStubClient(LLMClient):
         await asyncio.sleep(0)
         yield f"Minimax reply: {last}"[: self.max_tokens]
 
-    async def chat(self, messages: Iterable[ChatMessage]) -> str:
-        parts = []
-        async for chunk in self.complete(messages):
-            parts.append(chunk)
-        return "".join(parts)
-
 
-class MinimaxClient(LLMClient):
+class MinimaxClient(CachedChatMixin, LLMClient):
     def __init__(
         self,
         api_key: str,
@@ -50,6 +153,10 @@ class MinimaxClient(LLMClient):
         self.max_tokens = max_tokens
         self.api_url = api_url
         self.enable_streaming = enable_streaming
+        # One long-lived connection pool per client; a fresh AsyncClient per
+        # call would pay TCP/TLS setup on every turn.
+        self._http = httpx.AsyncClient(timeout=120, limits=_HTTP_LIMITS)
+        self._init_chat_cache()
 
     async def complete(self, messages: Iterable[ChatMessage]) -> AsyncIterator[str]:
         payload = {
@@ -68,42 +175,46 @@ class MinimaxClient(LLMClient):
 
         if self.enable_streaming:
             # Streaming mode: yield chunks as they arrive
-            async with httpx.AsyncClient(timeout=120) as client:
-                async with client.stream("POST", self.api_url, headers=headers, json=payload) as resp:
-                    resp.raise_for_status()
-                    async for line in resp.aiter_lines():
-                        if line.startswith("data: "):
-                            data_str = line[6:].strip()
-                            if data_str == "[DONE]":
-                                break
-                            try:
-                                import json
-
-                                data = json.loads(data_str)
-                                choices = data.get("choices") or data.get("data") or []
-                                if choices:
-                                    delta = choices[0].get("delta", {})
-                                    content = delta.get("content", "")
-                                    if content:
-                                        yield content
-                            except Exception:
-                                # Skip malformed chunks
-                                continue
+            async with self._http.stream("POST", self.api_url, headers=headers, json=payload) as resp:
+                resp.raise_for_status()
+                async for line in resp.aiter_lines():
+                    # Slice compare beats startswith on this hot per-line path
+                    if line[:6] == "data: ":
+                        data_str = line[6:].strip()
+                        if data_str == "[DONE]":
+                            break
+                        # Cheap structural checks before parsing: skip lines
+                        # that cannot be a JSON object and cap runaway ones,
+                        # rather than paying an exception per bad line.
+                        if len(data_str) > _SSE_LINE_LIMIT or data_str[:1] not in "{[":
+                            continue
+                        try:
+                            data = _loads(data_str)
+                        except _JSONDecodeErrors:
+                            continue
+                        choices = data.get("choices") or data.get("data") or []
+                        if choices:
+                            delta = choices[0].get("delta", {})
+                            content = delta.get("content", "")
+                            if content:
+                                yield content
         else:
             # Non-streaming mode: yield full response at once
-            async with httpx.AsyncClient(timeout=120) as client:
-                resp = await client.post(self.api_url, headers=headers, json=payload)
-                resp.raise_for_status()
-                data = resp.json()
-                choices = data.get("choices") or data.get("data") or []
-                if choices:
-                    content = choices[0].get("message", {}).get("content", "")
-                else:
-                    content = data.get("reply", "")
-                yield str(content)
+            resp = await self._http.post(self.api_url, headers=headers, json=payload)
+            resp.raise_for_status()
+            data = resp.json()
+            choices = data.get("choices") or data.get("data") or []
+            if choices:
+                content = choices[0].get("message", {}).get("content", "")
+            else:
+                content = data.get("reply", "")
+            yield str(content)
 
+    async def aclose(self) -> None:
+        await self._http.aclose()
 
-class OpenRouterClient(LLMClient):
+
+class OpenRouterClient(CachedChatMixin, LLMClient):
     """Client for OpenRouter API (supports Minimax and other models)."""
 
     def __init__(
@@ -118,11 +229,13 @@ class OpenRouterClient(LLMClient):
         self.max_tokens = max_tokens
         self.enable_streaming = enable_streaming
         self.api_url = "https://openrouter.ai/api/v1/chat/completions"
+        self._http = httpx.AsyncClient(timeout=120, limits=_HTTP_LIMITS)
+        self._init_chat_cache()
 
     async def complete(self, messages: Iterable[ChatMessage]) -> AsyncIterator[str]:
         payload = {
             "model": self.model,
-            "messages": [{"role": m.role, "content": m.content} for m in messages],
+            "messages": [_encode_message(m) for m in messages],
             "stream": self.enable_streaming,
             "max_tokens": self.max_tokens,
         }
@@ -133,39 +246,34 @@ class OpenRouterClient(LLMClient):
         }
 
         if self.enable_streaming:
-            async with httpx.AsyncClient(timeout=120) as client:
-                async with client.stream("POST", self.api_url, headers=headers, json=payload) as resp:
-                    resp.raise_for_status()
-                    async for line in resp.aiter_lines():
-                        if line.startswith("data: "):
-                            data_str = line[6:].strip()
-                            if data_str == "[DONE]":
-                                break
-                            try:
-                                import json
-
-                                data = json.loads(data_str)
-                                choices = data.get("choices", [])
-                                if choices:
-                                    delta = choices[0].get("delta", {})
-                                    content = delta.get("content", "")
-                                    if content:
-                                        yield content
-                            except Exception:
-                                continue
-        else:
-            async with httpx.AsyncClient(timeout=120) as client:
-                resp = await client.post(self.api_url, headers=headers, json=payload)
+            async with self._http.stream("POST", self.api_url, headers=headers, json=payload) as resp:
                 resp.raise_for_status()
-                data = resp.json()
-                choices = data.get("choices", [])
-                if choices:
-                    content = choices[0].get("message", {}).get("content", "")
-                    yield str(content)
+                async for line in resp.aiter_lines():
+                    if line[:6] == "data: ":
+                        data_str = line[6:].strip()
+                        if data_str == "[DONE]":
+                            break
+                        if len(data_str) > _SSE_LINE_LIMIT or data_str[:1] not in "{[":
+                            continue
+                        try:
+                            data = _loads(data_str)
+                        except _JSONDecodeErrors:
+                            continue
+                        choices = data.get("choices", [])
+                        if choices:
+                            delta = choices[0].get("delta", {})
+                            content = delta.get("content", "")
+                            if content:
+                                yield content
+        else:
+            resp = await self._http.post(self.api_url, headers=headers, json=payload)
+            resp.raise_for_status()
+            data = resp.json()
+            choices = data.get("choices", [])
+            if choices:
+                content = choices[0].get("message", {}).get("content", "")
+                yield str(content)
+
+    async def aclose(self) -> None:
+        await self._http.aclose()
 
-    async def chat(self, messages: Iterable[ChatMessage]) -> str:
-        """Convenience method to get the full response as a string."""
-        parts = []
-        async for chunk in self.complete(messages):
-            parts.append(chunk)
-        return "".join(parts)
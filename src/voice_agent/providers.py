@@ -1,32 +1,59 @@
 from __future__ import annotations
 
+from typing import Callable, Dict, Optional
+
 from .config import LLMConfig, STTConfig, TTSConfig
 from .llm import LLMClient, MinimaxClient, MinimaxStubClient, OpenRouterClient
 from .stt import EchoSTT, ElevenLabsSTT, STTClient, WhisperAPIClient
 from .tts import DummyTTS, ElevenLabsTTS, OpenAITTS, TTSClient
 
+# Provider registries: construction is a dict lookup instead of an if/elif
+# ladder, and new providers register here without editing the factories.
+# Factories are only consulted when an api_key is present; each may still
+# return None when provider-specific requirements are unmet, falling back
+# to the offline default.
+
+_LLM_FACTORIES: Dict[str, Callable[[LLMConfig], Optional[LLMClient]]] = {
+    "openrouter": lambda cfg: OpenRouterClient(api_key=cfg.api_key, model=cfg.model, max_tokens=cfg.max_tokens),
+    "minimax": lambda cfg: MinimaxClient(api_key=cfg.api_key, model=cfg.model, max_tokens=cfg.max_tokens),
+}
+
+_STT_FACTORIES: Dict[str, Callable[[STTConfig], Optional[STTClient]]] = {
+    "whisper_api": lambda cfg: WhisperAPIClient(api_key=cfg.api_key, language=cfg.language),
+    "elevenlabs": lambda cfg: ElevenLabsSTT(api_key=cfg.api_key),
+}
+
+_TTS_FACTORIES: Dict[str, Callable[[TTSConfig], Optional[TTSClient]]] = {
+    "elevenlabs": lambda cfg: ElevenLabsTTS(api_key=cfg.api_key, voice_id=cfg.voice_id) if cfg.voice_id else None,
+    "openai": lambda cfg: OpenAITTS(api_key=cfg.api_key, voice=cfg.voice_id or "alloy"),
+}
+
 
 def build_llm(cfg: LLMConfig) -> LLMClient:
-    if cfg.provider == "openrouter" and cfg.api_key:
-        return OpenRouterClient(api_key=cfg.api_key, model=cfg.model, max_tokens=cfg.max_tokens)
     if cfg.api_key:
-        return MinimaxClient(api_key=cfg.api_key, model=cfg.model, max_tokens=cfg.max_tokens)
+        # Unknown providers with a key keep the historical Minimax default
+        factory = _LLM_FACTORIES.get(cfg.provider, _LLM_FACTORIES["minimax"])
+        client = factory(cfg)
+        if client is not None:
+            return client
     return MinimaxStubClient(model=cfg.model, max_tokens=cfg.max_tokens)
 
 
 def build_stt(cfg: STTConfig) -> STTClient:
-    if cfg.provider == "whisper_api" and cfg.api_key:
-        return WhisperAPIClient(api_key=cfg.api_key, language=cfg.language)
-    if cfg.provider == "elevenlabs" and cfg.api_key:
-        return ElevenLabsSTT(api_key=cfg.api_key)
+    if cfg.api_key:
+        factory = _STT_FACTORIES.get(cfg.provider)
+        if factory is not None:
+            client = factory(cfg)
+            if client is not None:
+                return client
     return EchoSTT()
 
 
 def build_tts(cfg: TTSConfig) -> TTSClient:
-    if cfg.provider == "elevenlabs" and cfg.api_key and cfg.voice_id:
-        return ElevenLabsTTS(api_key=cfg.api_key, voice_id=cfg.voice_id)
-    if cfg.provider == "openai" and cfg.api_key:
-        # Use voice_id if provided, otherwise default to "alloy"
-        voice = cfg.voice_id if cfg.voice_id else "alloy"
-        return OpenAITTS(api_key=cfg.api_key, voice=voice)
+    if cfg.api_key:
+        factory = _TTS_FACTORIES.get(cfg.provider)
+        if factory is not None:
+            client = factory(cfg)
+            if client is not None:
+                return client
     return DummyTTS()
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import json
+import math
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional
+
+
+class SemanticCache:
+    """Similarity-keyed LRU cache for short LLM responses.
+
+    Prompts are embedded as normalized hashed bag-of-words vectors and
+    matched by cosine similarity, so near-duplicate prompts (the common case
+    for per-turn summaries) reuse a cached response instead of paying a new
+    LLM round trip. The embedding is deliberately cheap and local — no model
+    download, no extra dependency.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        threshold: float = 0.92,
+        path: Optional[Path] = None,
+    ) -> None:
+        self.max_entries = max_entries
+        self.threshold = threshold
+        self.path = path
+        # prompt -> (embedding, response, ts); insertion order doubles as LRU
+        self._entries: "OrderedDict[str, tuple[Dict[int, float], str, float]]" = OrderedDict()
+        if path is not None and path.exists():
+            self._load(path)
+
+    @staticmethod
+    def _embed(text: str) -> Dict[int, float]:
+        vector: Dict[int, float] = {}
+        for token in text.lower().split():
+            key = hash(token) & 0xFFFF
+            vector[key] = vector.get(key, 0.0) + 1.0
+        norm = math.sqrt(sum(weight * weight for weight in vector.values()))
+        if norm:
+            for key in vector:
+                vector[key] /= norm
+        return vector
+
+    @staticmethod
+    def _cosine(a: Dict[int, float], b: Dict[int, float]) -> float:
+        if len(b) < len(a):
+            a, b = b, a
+        return sum(weight * b.get(key, 0.0) for key, weight in a.items())
+
+    def get(self, prompt: str) -> Optional[str]:
+        query = self._embed(prompt)
+        best_key = None
+        best_score = self.threshold
+        for key, (embedding, _, _) in self._entries.items():
+            score = self._cosine(query, embedding)
+            if score >= best_score:
+                best_score = score
+                best_key = key
+        if best_key is None:
+            return None
+        self._entries.move_to_end(best_key)
+        return self._entries[best_key][1]
+
+    def put(self, prompt: str, response: str) -> None:
+        self._entries[prompt] = (self._embed(prompt), response, time.time())
+        self._entries.move_to_end(prompt)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        if self.path is not None:
+            with self.path.open("a", encoding="utf-8") as file:
+                file.write(json.dumps({"prompt": prompt, "response": response}, ensure_ascii=False) + "\n")
+
+    def _load(self, path: Path) -> None:
+        with path.open("r", encoding="utf-8") as file:
+            for line in file:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                prompt = record.get("prompt")
+                response = record.get("response")
+                if prompt and response:
+                    self._entries[prompt] = (self._embed(prompt), response, time.time())
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
@@ -1,19 +1,86 @@
 from __future__ import annotations
 
 import json
+import queue
+import threading
 import time
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+if orjson is not None:
+    _dumps = orjson.dumps
+else:
+    def _dumps(record: Dict[str, Any]) -> bytes:
+        return json.dumps(record, ensure_ascii=False).encode("utf-8")
 
 
 class SessionStore:
+    """Append-only JSONL store with a background writer thread.
+
+    Records are enqueued from the async dialog path and written by a daemon
+    thread holding a single open handle, so disk latency never blocks a
+    turn. Bursts are coalesced into one write per drain.
+    """
+
     def __init__(self, path: Path) -> None:
         self.path = path
         self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._queue: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue()
+        self._fh = None
+        self._writer: Optional[threading.Thread] = None
 
     def append(self, record: Dict[str, Any]) -> None:
-        with self.path.open("a", encoding="utf-8") as file:
-            file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._ensure_writer()
+        self._queue.put(record)
+
+    def _ensure_writer(self) -> None:
+        if self._writer is not None:
+            return
+        # Binary append mode: records serialize straight to bytes (orjson
+        # when available), skipping the text-layer encode on every write.
+        self._fh = self.path.open("ab", buffering=1 << 16)
+        self._writer = threading.Thread(target=self._drain, name="session-writer", daemon=True)
+        self._writer.start()
+
+    def _drain(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = None in batch
+            lines = [_dumps(record) for record in batch if record is not None]
+            if lines:
+                self._fh.write(b"\n".join(lines) + b"\n")
+                self._fh.flush()
+            for _ in batch:
+                self._queue.task_done()
+            if stop:
+                return
+
+    def flush(self) -> None:
+        """Block until every queued record has reached the file."""
+        if self._writer is None:
+            return
+        self._queue.join()
+
+    def close(self) -> None:
+        """Flush pending records and stop the writer thread."""
+        if self._writer is None:
+            return
+        self._queue.put(None)
+        self._writer.join()
+        self._fh.close()
+        self._fh = None
+        self._writer = None
 
     def record_turn(self, session_id: str, user_text: str, response_text: str, tools: List[Dict[str, Any]]) -> None:
         self.append(
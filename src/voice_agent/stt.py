@@ -1,14 +1,12 @@
 from __future__ import annotations
 
 import asyncio
-import io
-import wave
 from dataclasses import dataclass
-from typing import AsyncIterator, List, Optional
+from typing import AsyncIterator, Optional
 
 import httpx
 
-from .audio import AudioFrame
+from .audio import AudioFrame, pcm16_to_wav
 
 
 @dataclass
@@ -21,6 +19,24 @@ class STTClient:
     async def stream_transcribe(self, frames: AsyncIterator[AudioFrame]) -> AsyncIterator[TranscriptChunk]:
         raise NotImplementedError
 
+    async def transcribe_batch(self, pcm: bytes) -> str:
+        """Transcribe one complete utterance of raw PCM in a single call.
+
+        The default routes through stream_transcribe so every client
+        supports it; clients that upload the whole utterance anyway
+        override this to skip the streaming machinery.
+        """
+        async def frames() -> AsyncIterator[AudioFrame]:
+            yield AudioFrame(timestamp=0.0, data=pcm)
+
+        text = ""
+        async for chunk in self.stream_transcribe(frames()):
+            if chunk.final:
+                return (chunk.text or text).strip()
+            if chunk.text:
+                text = chunk.text
+        return text.strip()
+
     async def transcribe_text(self, text: str) -> TranscriptChunk:
         await asyncio.sleep(0)
         return TranscriptChunk(text=text, final=True)
@@ -43,24 +59,21 @@ class WhisperAPIClient(STTClient):
         self.sample_rate = sample_rate
 
     async def stream_transcribe(self, frames: AsyncIterator[AudioFrame]) -> AsyncIterator[TranscriptChunk]:
-        collected: List[bytes] = []
+        # Grow one bytearray instead of a list of frame copies + join, so the
+        # utterance PCM is held in memory once.
+        buf = bytearray()
         async for frame in frames:
-            collected.append(frame.data)
-        if not collected:
+            buf.extend(frame.data)
+        if not buf:
             return
-        audio_bytes = b"".join(collected)
-        wav_bytes = self._pcm_to_wav(audio_bytes)
+        wav_bytes = pcm16_to_wav(bytes(buf), self.sample_rate)
         text = await self._send(wav_bytes)
         yield TranscriptChunk(text=text, final=True)
 
-    def _pcm_to_wav(self, pcm: bytes) -> bytes:
-        buffer = io.BytesIO()
-        with wave.open(buffer, "wb") as wf:
-            wf.setnchannels(1)
-            wf.setsampwidth(2)
-            wf.setframerate(self.sample_rate)
-            wf.writeframes(pcm)
-        return buffer.getvalue()
+    async def transcribe_batch(self, pcm: bytes) -> str:
+        if not pcm:
+            return ""
+        return (await self._send(pcm16_to_wav(pcm, self.sample_rate))).strip()
 
     async def _send(self, wav_bytes: bytes) -> str:
         headers = {"Authorization": f"Bearer {self.api_key}"}
@@ -87,25 +100,20 @@ class ElevenLabsSTT(STTClient):
         self.sample_rate = sample_rate
 
     async def stream_transcribe(self, frames: AsyncIterator[AudioFrame]) -> AsyncIterator[TranscriptChunk]:
-        collected: List[bytes] = []
+        buf = bytearray()
         async for frame in frames:
-            collected.append(frame.data)
-        if not collected:
+            buf.extend(frame.data)
+        if not buf:
             return
-        audio_bytes = b"".join(collected)
         # ElevenLabs expects audio in supported formats (mp3, wav, etc.)
-        wav_bytes = self._pcm_to_wav(audio_bytes)
+        wav_bytes = pcm16_to_wav(bytes(buf), self.sample_rate)
         text = await self._send(wav_bytes)
         yield TranscriptChunk(text=text, final=True)
 
-    def _pcm_to_wav(self, pcm: bytes) -> bytes:
-        buffer = io.BytesIO()
-        with wave.open(buffer, "wb") as wf:
-            wf.setnchannels(1)
-            wf.setsampwidth(2)
-            wf.setframerate(self.sample_rate)
-            wf.writeframes(pcm)
-        return buffer.getvalue()
+    async def transcribe_batch(self, pcm: bytes) -> str:
+        if not pcm:
+            return ""
+        return (await self._send(pcm16_to_wav(pcm, self.sample_rate))).strip()
 
     async def _send(self, wav_bytes: bytes) -> str:
         headers = {"xi-api-key": self.api_key}
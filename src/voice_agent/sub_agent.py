@@ -1,14 +1,52 @@
 from __future__ import annotations
 
 import asyncio
+import re
 import uuid
+from collections import OrderedDict, deque
 from dataclasses import dataclass
 from enum import Enum
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from .llm import ChatMessage, LLMClient
+from .semantic_cache import SemanticCache
 from .tool_runner import ToolResult, ToolRunner
 
+# Slot-filled parameters are stripped before plan-cache lookups so tasks
+# that differ only in a number, path, or URL can share a plan.
+_SLOT_PATTERN = re.compile(r"https?://\S+|(?:/[\w.\-]+)+|\b\d+\b")
+
+# Similarity floor for reusing a cached plan
+_PLAN_CACHE_THRESHOLD = 0.90
+
+# Once this much of a streaming plan has arrived, execution starts against
+# the partial plan; the opening steps are what execution needs first, so the
+# second round trip overlaps the rest of planner decode.
+_SPECULATIVE_PLAN_CHARS = 120
+
+# Most sub-agents kept in the registry; completed ones past this are evicted
+# oldest-first so long sessions hold constant memory.
+_AGENT_CAP = 256
+
+_BASE_PROMPT = "You are a helpful sub-agent executing a specific task. You can use tools to accomplish your goals."
+
+# Full system prompts pre-joined per specialty; the set is finite and known
+# at import time, so nothing is rebuilt per agent start.
+_SPECIALTY_PROMPTS = {
+    specialty: f"{_BASE_PROMPT}\n\n{detail}"
+    for specialty, detail in {
+        "coding": "You specialize in writing, debugging, and analyzing code. You understand multiple programming languages and can use command-line tools effectively.",
+        "research": "You specialize in researching information, gathering data from various sources, and synthesizing findings. You can search the web and analyze documents.",
+        "system": "You specialize in system administration and operations. You can execute shell commands, manage files, and interact with the system.",
+        "network": "You specialize in network operations. You can SSH into remote systems, check network connectivity, and manage network resources.",
+        "hardware": "You specialize in hardware interaction. You can communicate with devices over serial ports, USB, and other interfaces.",
+    }.items()
+}
+
+
+def _normalise_task(task: str) -> str:
+    return _SLOT_PATTERN.sub(" ", task).lower()
+
 
 class AgentStatus(Enum):
     """Status of a sub-agent."""
@@ -46,6 +84,7 @@ class SubAgent:
         llm: LLMClient,
         tool_runner: ToolRunner,
         specialty: Optional[str] = None,
+        plan_cache: Optional[SemanticCache] = None,
     ) -> None:
         """Initialize a sub-agent.
 
@@ -55,6 +94,7 @@ class SubAgent:
             llm: LLM client for decision-making
             tool_runner: Tool runner for executing commands
             specialty: Optional specialty/role for this agent (e.g., "coding", "research")
+            plan_cache: Optional cache of plans for similar past tasks
         """
         self.agent_id = agent_id
         self.task_description = task_description
@@ -64,6 +104,7 @@ class SubAgent:
         self.status = AgentStatus.PENDING
         self._task: Optional[asyncio.Task] = None
         self._result: Optional[AgentResult] = None
+        self._plan_cache = plan_cache
 
     async def start(self) -> None:
         """Start the agent's execution in the background."""
@@ -101,37 +142,43 @@ class SubAgent:
 
     async def _execute(self) -> None:
         """Execute the agent's task."""
+        exec_task: Optional[asyncio.Task[str]] = None
         try:
             # Build system prompt based on specialty
             system_prompt = self._get_system_prompt()
 
-            # Create a plan for the task
-            planning_messages = [
-                ChatMessage(role="system", content=system_prompt),
-                ChatMessage(
-                    role="user",
-                    content=f"Task: {self.task_description}\n\nCreate a brief plan (2-4 steps) to accomplish this task.",
-                ),
-            ]
-
-            plan = await self.llm.chat(planning_messages)
-
-            # Execute the plan
-            execution_messages = [
-                ChatMessage(role="system", content=system_prompt),
-                ChatMessage(role="user", content=f"Task: {self.task_description}"),
-                ChatMessage(role="assistant", content=f"Plan:\n{plan}"),
-                ChatMessage(role="user", content="Execute this plan now. Use tools as needed and provide a summary of results."),
-            ]
+            # Create a plan for the task; similar past tasks (same specialty,
+            # slot parameters stripped) reuse their cached plan and skip the
+            # planning LLM call entirely.
+            cache_key = _normalise_task(self.task_description)
+            plan = self._plan_cache.get(cache_key) if self._plan_cache is not None else None
+            if plan is None:
+                planning_messages = [
+                    ChatMessage(role="system", content=system_prompt),
+                    ChatMessage(
+                        role="user",
+                        content=f"Task: {self.task_description}\n\nCreate a brief plan (2-4 steps) to accomplish this task.",
+                    ),
+                ]
+                # Stream the planner and start execution speculatively once
+                # enough of the plan has arrived, overlapping the two round
+                # trips instead of serializing them.
+                plan_parts: List[str] = []
+                plan_len = 0
+                async for token in self.llm.complete(planning_messages):
+                    plan_parts.append(token)
+                    plan_len += len(token)
+                    if exec_task is None and plan_len >= _SPECULATIVE_PLAN_CHARS:
+                        exec_task = asyncio.create_task(self._run_execution(system_prompt, "".join(plan_parts)))
+                plan = "".join(plan_parts)
+                if self._plan_cache is not None and plan:
+                    self._plan_cache.put(cache_key, plan)
+
+            if exec_task is None:
+                exec_task = asyncio.create_task(self._run_execution(system_prompt, plan))
 
             tool_results: List[ToolResult] = []
-            result_text_parts: List[str] = []
-
-            # Stream the execution response
-            async for chunk in self.llm.complete(execution_messages):
-                result_text_parts.append(chunk)
-
-            result_text = "".join(result_text_parts)
+            result_text = await exec_task
 
             # Mark as completed
             self.status = AgentStatus.COMPLETED
@@ -144,6 +191,7 @@ class SubAgent:
             )
 
         except asyncio.CancelledError:
+            await self._reap_speculation(exec_task)
             self.status = AgentStatus.CANCELLED
             self._result = AgentResult(
                 agent_id=self.agent_id,
@@ -154,6 +202,7 @@ class SubAgent:
             )
             raise
         except Exception as e:
+            await self._reap_speculation(exec_task)
             self.status = AgentStatus.FAILED
             self._result = AgentResult(
                 agent_id=self.agent_id,
@@ -164,32 +213,58 @@ class SubAgent:
                 error=str(e),
             )
 
-    def _get_system_prompt(self) -> str:
-        """Get the system prompt based on agent specialty."""
-        base_prompt = "You are a helpful sub-agent executing a specific task. You can use tools to accomplish your goals."
+    @staticmethod
+    async def _reap_speculation(exec_task: "Optional[asyncio.Task[str]]") -> None:
+        """Cancel a speculative execution left running by a failed plan.
 
-        specialty_prompts = {
-            "coding": "You specialize in writing, debugging, and analyzing code. You understand multiple programming languages and can use command-line tools effectively.",
-            "research": "You specialize in researching information, gathering data from various sources, and synthesizing findings. You can search the web and analyze documents.",
-            "system": "You specialize in system administration and operations. You can execute shell commands, manage files, and interact with the system.",
-            "network": "You specialize in network operations. You can SSH into remote systems, check network connectivity, and manage network resources.",
-            "hardware": "You specialize in hardware interaction. You can communicate with devices over serial ports, USB, and other interfaces.",
-        }
+        Awaiting also retrieves the exception of an already-failed task so
+        it is never reported as lost.
+        """
+        if exec_task is None:
+            return
+        exec_task.cancel()
+        try:
+            await exec_task
+        except (asyncio.CancelledError, Exception):
+            pass
+
+    async def _run_execution(self, system_prompt: str, plan: str) -> str:
+        """Run the execution request for a (possibly partial) plan."""
+        execution_messages = [
+            ChatMessage(role="system", content=system_prompt),
+            ChatMessage(role="user", content=f"Task: {self.task_description}"),
+            ChatMessage(role="assistant", content=f"Plan:\n{plan}"),
+            ChatMessage(role="user", content="Execute this plan now. Use tools as needed and provide a summary of results."),
+        ]
+        result_parts: List[str] = []
+        async for chunk in self.llm.complete(execution_messages):
+            result_parts.append(chunk)
+        return "".join(result_parts)
 
-        specialty_prompt = specialty_prompts.get(self.specialty, "")
-        if specialty_prompt:
-            return f"{base_prompt}\n\n{specialty_prompt}"
-        return base_prompt
+    def _get_system_prompt(self) -> str:
+        """Get the system prompt based on agent specialty."""
+        return _SPECIALTY_PROMPTS.get(self.specialty, _BASE_PROMPT)
 
 
 class AgentOrchestrator:
     """Manages multiple sub-agents and their execution."""
 
     def __init__(self, llm: LLMClient, tool_runner: ToolRunner) -> None:
+        # Sub-agents stream both their planning and execution calls, which
+        # BatchLLMClient passes straight through, so the orchestrator uses
+        # the client as given; callers wanting chat() micro-batching wrap
+        # their client in BatchLLMClient themselves.
         self.llm = llm
         self.tool_runner = tool_runner
-        self._agents: dict[str, SubAgent] = {}
+        self._agents: "OrderedDict[str, SubAgent]" = OrderedDict()
+        # Bounded history of completed results for inspection after their
+        # agents have been evicted from the registry
+        self._finished: "deque[AgentResult]" = deque(maxlen=_AGENT_CAP)
         self._results_queue: asyncio.Queue[AgentResult] = asyncio.Queue()
+        self._active_count = 0
+        # One plan cache per specialty so a coding plan can never be served
+        # to, say, a network agent with a similar-sounding task.
+        self._plan_caches: Dict[str, SemanticCache] = {}
 
     def spawn_agent(self, task_description: str, specialty: Optional[str] = None) -> str:
         """Spawn a new sub-agent for a task.
@@ -201,28 +276,56 @@ class AgentOrchestrator:
         Returns:
             The agent ID
         """
-        agent_id = str(uuid.uuid4())[:8]  # Short ID for readability
+        if len(self._agents) >= _AGENT_CAP:
+            # Evict oldest completed agents; running ones are never dropped
+            for old_id, old_agent in list(self._agents.items()):
+                if old_agent.is_done():
+                    del self._agents[old_id]
+                    if len(self._agents) < _AGENT_CAP:
+                        break
+        agent_id = uuid.uuid4().hex[:8]  # Short ID for readability
+        cache_key = specialty or "general"
+        plan_cache = self._plan_caches.get(cache_key)
+        if plan_cache is None:
+            plan_cache = self._plan_caches[cache_key] = SemanticCache(threshold=_PLAN_CACHE_THRESHOLD)
         agent = SubAgent(
             agent_id=agent_id,
             task_description=task_description,
             llm=self.llm,
             tool_runner=self.tool_runner,
             specialty=specialty,
+            plan_cache=plan_cache,
         )
         self._agents[agent_id] = agent
+        self._active_count += 1
         asyncio.create_task(self._run_agent(agent))
         return agent_id
 
     async def _run_agent(self, agent: SubAgent) -> None:
         """Run an agent and queue its result."""
-        await agent.start()
-        result = await agent.wait()
-        await self._results_queue.put(result)
+        try:
+            await agent.start()
+            result = await agent.wait()
+            self._finished.append(result)
+            await self._results_queue.put(result)
+        finally:
+            self._active_count -= 1
+
+    def has_activity(self) -> bool:
+        """True when agents are running or results are waiting to be drained."""
+        return self._active_count > 0 or not self._results_queue.empty()
 
     def get_agent(self, agent_id: str) -> Optional[SubAgent]:
         """Get an agent by ID."""
         return self._agents.get(agent_id)
 
+    def get_result(self, agent_id: str) -> Optional[AgentResult]:
+        """Completed result for an agent, surviving registry eviction."""
+        for result in reversed(self._finished):
+            if result.agent_id == agent_id:
+                return result
+        return None
+
     async def cancel_agent(self, agent_id: str) -> bool:
         """Cancel an agent's execution."""
         agent = self._agents.get(agent_id)
@@ -232,15 +335,34 @@ class AgentOrchestrator:
         return False
 
     async def next_result(self, timeout: float = 0) -> Optional[AgentResult]:
-        """Get the next completed agent result."""
+        """Get the next result, or None when none arrives within timeout.
+
+        An already-queued result is returned synchronously; wait_for with a
+        zero timeout would cancel the get before it could observe one.
+        """
+        try:
+            return self._results_queue.get_nowait()
+        except asyncio.QueueEmpty:
+            if timeout <= 0:
+                return None
         try:
             return await asyncio.wait_for(self._results_queue.get(), timeout=timeout)
         except asyncio.TimeoutError:
             return None
 
+    def drain_results(self) -> List[AgentResult]:
+        """Pop every currently available agent result without awaiting."""
+        results: List[AgentResult] = []
+        while True:
+            try:
+                results.append(self._results_queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        return results
+
     def list_agents(self) -> List[dict]:
-        """List all agents and their status."""
-        return [
+        """List all agents and their status, including evicted finished ones."""
+        entries = [
             {
                 "agent_id": agent.agent_id,
                 "task": agent.task_description,
@@ -249,6 +371,19 @@ class AgentOrchestrator:
             }
             for agent in self._agents.values()
         ]
+        listed = set(self._agents)
+        for result in self._finished:
+            if result.agent_id not in listed:
+                # Results do not record specialty; evicted entries carry None
+                entries.append(
+                    {
+                        "agent_id": result.agent_id,
+                        "task": result.task_description,
+                        "specialty": None,
+                        "status": result.status.value,
+                    }
+                )
+        return entries
 
     async def cancel_all(self) -> None:
         """Cancel all running agents."""
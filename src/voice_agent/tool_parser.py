@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import json
-import re
 from dataclasses import dataclass
 from typing import List, Optional
 
@@ -35,15 +34,15 @@ class ToolParser:
     is spoken to the user.
     """
 
-    TOOL_PATTERN = re.compile(
-        r'<tool\s+type="([^"]+)"(?:\s+silent="(true|false)")?(?:\s+(\w+)="([^"]+)")*>(.*?)</tool>', re.DOTALL
-    )
-    TOOL_JSON_PATTERN = re.compile(r"```tool\s*\n(.*?)\n```", re.DOTALL)
-
     @classmethod
     def parse_response(cls, llm_response: str) -> ParsedResponse:
         """Parse an LLM response to extract tool requests and speech text.
 
+        Single linear scan: kept slices accumulate in a list by offset and
+        are joined once, so cost stays O(n) however many tags appear and a
+        tag body repeated elsewhere in the speech can never be removed by
+        accident.
+
         Args:
             llm_response: The raw response from the LLM
 
@@ -51,55 +50,126 @@ class ToolParser:
             ParsedResponse with separated speech text and tool requests
         """
         tool_requests: List[ToolRequest] = []
-        remaining_text = llm_response
-
-        # Parse XML-style tool tags
-        for match in cls.TOOL_PATTERN.finditer(llm_response):
-            full_match = match.group(0)
-            tool_type = match.group(1)
-            silent_str = match.group(2)
-            content = match.group(5).strip()
-
-            silent = silent_str != "false"  # Default to true
-
-            # Extract additional attributes
-            args = {"command": content}
-            # Simple attribute parsing (can be enhanced)
-            attr_pattern = re.compile(r'(\w+)="([^"]+)"')
-            for attr_match in attr_pattern.finditer(match.group(0)):
-                attr_name = attr_match.group(1)
-                attr_value = attr_match.group(2)
-                if attr_name not in ["type", "silent"]:
-                    args[attr_name] = attr_value
-
-            tool_requests.append(ToolRequest(tool_type=tool_type, args=args, silent=silent))
-            remaining_text = remaining_text.replace(full_match, "")
-
-        # Parse JSON-style tool blocks
-        for match in cls.TOOL_JSON_PATTERN.finditer(llm_response):
-            full_match = match.group(0)
-            json_content = match.group(1).strip()
-            try:
-                tool_data = json.loads(json_content)
-                if isinstance(tool_data, dict):
-                    tool_type = tool_data.get("type", "shell")
-                    args = {k: v for k, v in tool_data.items() if k not in ["type", "silent"]}
-                    silent = tool_data.get("silent", True)
-                    tool_requests.append(ToolRequest(tool_type=tool_type, args=args, silent=silent))
-                    remaining_text = remaining_text.replace(full_match, "")
-            except json.JSONDecodeError:
-                # Invalid JSON, leave it in the text
-                pass
-
-        # Clean up the remaining text
-        speech_text = remaining_text.strip()
-
+        speech_parts: List[str] = []
+        text = llm_response
+        i = 0
+        n = len(text)
+        while i < n:
+            xml_at = text.find("<tool", i)
+            json_at = text.find("```tool", i)
+            if xml_at == -1 and json_at == -1:
+                speech_parts.append(text[i:])
+                break
+            if json_at == -1 or (xml_at != -1 and xml_at < json_at):
+                parsed = cls._parse_xml_tag(text, xml_at)
+                if parsed is None:
+                    # Not a well-formed tag; keep the literal text
+                    speech_parts.append(text[i : xml_at + 5])
+                    i = xml_at + 5
+                    continue
+                end, request = parsed
+                speech_parts.append(text[i:xml_at])
+                tool_requests.append(request)
+                i = end
+            else:
+                parsed = cls._parse_json_block(text, json_at)
+                if parsed is None:
+                    speech_parts.append(text[i : json_at + 7])
+                    i = json_at + 7
+                    continue
+                end, request = parsed
+                speech_parts.append(text[i:json_at])
+                if request is not None:
+                    tool_requests.append(request)
+                else:
+                    # Invalid JSON, leave the block in the text
+                    speech_parts.append(text[json_at:end])
+                i = end
+
+        speech_text = "".join(speech_parts).strip()
         return ParsedResponse(speech_text=speech_text, tool_requests=tool_requests)
 
+    @classmethod
+    def _parse_xml_tag(cls, text: str, start: int) -> Optional[tuple]:
+        """Parse one <tool ...>...</tool> tag; None when malformed."""
+        close = text.find(">", start + 5)
+        if close == -1:
+            return None
+        attrs = cls._parse_attrs(text[start + 5 : close])
+        if attrs is None or "type" not in attrs:
+            return None
+        body_end = text.find("</tool>", close + 1)
+        if body_end == -1:
+            return None
+        args = {"command": text[close + 1 : body_end].strip()}
+        for name, value in attrs.items():
+            if name not in ("type", "silent"):
+                args[name] = value
+        silent = attrs.get("silent") != "false"  # Default to true
+        return body_end + 7, ToolRequest(tool_type=attrs["type"], args=args, silent=silent)
+
+    @staticmethod
+    def _parse_attrs(span: str) -> Optional[dict]:
+        """Parse a name="value" attribute span; None when malformed.
+
+        Replaces the attribute regex the old parser recompiled per tag;
+        no pattern objects are built on this path at all now.
+        """
+        attrs: dict = {}
+        i = 0
+        n = len(span)
+        while i < n:
+            while i < n and span[i].isspace():
+                i += 1
+            if i >= n:
+                break
+            j = i
+            while j < n and (span[j].isalnum() or span[j] == "_"):
+                j += 1
+            if j == i or j + 1 >= n or span[j] != "=" or span[j + 1] != '"':
+                return None
+            k = span.find('"', j + 2)
+            if k == -1:
+                return None
+            attrs[span[i:j]] = span[j + 2 : k]
+            i = k + 1
+        return attrs
+
+    @staticmethod
+    def _parse_json_block(text: str, start: int) -> Optional[tuple]:
+        """Parse one \`\`\`tool fenced block; None when malformed.
+
+        Returns (end, ToolRequest) for a valid block, (end, None) when the
+        fence is intact but the JSON is invalid so the block should stay in
+        the speech text.
+        """
+        nl = text.find("\n", start + 7)
+        if nl == -1 or text[start + 7 : nl].strip():
+            return None
+        fence = text.find("\n```", nl + 1)
+        if fence == -1:
+            return None
+        end = fence + 4
+        try:
+            tool_data = json.loads(text[nl + 1 : fence].strip())
+        except json.JSONDecodeError:
+            return end, None
+        if not isinstance(tool_data, dict):
+            return end, None
+        tool_type = tool_data.get("type", "shell")
+        args = {k: v for k, v in tool_data.items() if k not in ["type", "silent"]}
+        silent = tool_data.get("silent", True)
+        return end, ToolRequest(tool_type=tool_type, args=args, silent=silent)
+
     @classmethod
     def get_tool_system_prompt(cls) -> str:
         """Get the system prompt that explains tool usage to the LLM."""
-        return """You are a helpful voice assistant with access to tools. You can execute commands silently in the background while continuing the conversation.
+        return _TOOL_SYSTEM_PROMPT
+
+
+# Constant prompt text; callers fetch it per turn, so it is built once at
+# import rather than re-evaluated on every call.
+_TOOL_SYSTEM_PROMPT = """You are a helpful voice assistant with access to tools. You can execute commands silently in the background while continuing the conversation.
 
 Available tools:
 - shell commands: Execute terminal commands
@@ -1,14 +1,58 @@
 from __future__ import annotations
 
 import asyncio
+import shlex
 import time
 import uuid
 from dataclasses import dataclass
-from typing import Dict, Optional
-
-import httpx
+from typing import Dict, List, Optional
 
 from .config import ToolConfig
+from .http import get_client
+
+
+# Pooled SSH connections unused for this long are closed
+_SSH_IDLE_SECONDS = 300
+
+# A serial read that returns nothing for this long after data has arrived
+# means the device has finished responding
+_SERIAL_IDLE_TIMEOUT = 0.2
+
+# Characters whose presence requires a real shell (pipes, redirects,
+# globbing, substitution, quoting)
+_SHELL_METACHARS = set("|&;<>*?$`()[]{}~#'\"\\\n")
+
+
+def _needs_shell(command: str) -> bool:
+    return any(c in _SHELL_METACHARS for c in command)
+
+
+def _serial_exchange(port: str, payload: str, baudrate: int, read_seconds: float) -> bytes:
+    """Blocking write/read-until-idle exchange; runs off the event loop."""
+    import serial  # type: ignore
+
+    ser = serial.Serial(port, baudrate=baudrate, timeout=_SERIAL_IDLE_TIMEOUT)
+    try:
+        ser.write(payload.encode())
+        chunks = []
+        deadline = time.monotonic() + read_seconds
+        while time.monotonic() < deadline:
+            data = ser.read(4096)
+            if data:
+                chunks.append(data)
+            elif chunks:
+                # Device responded and has gone idle; no point waiting out
+                # the rest of the window
+                break
+        return b"".join(chunks)
+    finally:
+        ser.close()
+
+
+def _truncate_decode(raw: bytes, max_chars: int) -> str:
+    # Slice bytes before decoding so multi-MB outputs do not pay a full
+    # decode for a few kept KB; x4 covers worst-case UTF-8 width.
+    return raw[: max_chars * 4].decode(errors="replace")[:max_chars]
 
 
 @dataclass
@@ -27,15 +71,39 @@ class ToolRunner:
         self.config = config
         self._tasks: Dict[str, asyncio.Task[ToolResult]] = {}
         self._results: asyncio.Queue[ToolResult] = asyncio.Queue()
+        # SSH connections pooled per (host, username, port); the key
+        # exchange is paid once instead of per command. Entries are connect
+        # tasks, so the pool can be shared without serializing connects.
+        self._ssh_pool: Dict[tuple, "asyncio.Task"] = {}
+        self._ssh_last_used: Dict[tuple, float] = {}
+        self._ssh_lock = asyncio.Lock()
+        # Set (when assigned) each time a background result is queued, so
+        # pollers can park on it instead of sleeping on a timer
+        self.result_event: Optional[asyncio.Event] = None
 
     async def run_command(self, command: str, timeout: Optional[int] = None) -> ToolResult:
         timeout = timeout or self.config.default_timeout
         start = time.perf_counter()
-        process = await asyncio.create_subprocess_shell(
-            command,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
+        process = None
+        if not _needs_shell(command):
+            # Plain commands skip the intermediate /bin/sh fork. Anything
+            # the direct exec cannot start — missing binary, empty command,
+            # unbalanced quoting — falls back to the shell below, which
+            # reports such failures as an exit code instead of raising.
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    *shlex.split(command),
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                )
+            except (OSError, ValueError, TypeError):
+                process = None
+        if process is None:
+            process = await asyncio.create_subprocess_shell(
+                command,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
 
         timed_out = False
         try:
@@ -47,8 +115,8 @@ class ToolRunner:
             stdout_bytes, stderr_bytes = b"", b""
 
         duration = time.perf_counter() - start
-        stdout = stdout_bytes.decode(errors="replace")[: self.config.max_output_chars]
-        stderr = stderr_bytes.decode(errors="replace")[: self.config.max_output_chars]
+        stdout = _truncate_decode(stdout_bytes, self.config.max_output_chars)
+        stderr = _truncate_decode(stderr_bytes, self.config.max_output_chars)
 
         return ToolResult(
             task_id="",
@@ -64,19 +132,26 @@ class ToolRunner:
         timeout = timeout or self.config.default_timeout
         start = time.perf_counter()
         try:
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                resp = await client.request(method, url)
-                content = resp.text[: self.config.max_output_chars]
+            # Stream the body and stop reading once the output cap is hit,
+            # saving both decode work and network bytes on large pages
+            byte_cap = self.config.max_output_chars * 4
+            async with get_client().stream(method, url, timeout=timeout) as resp:
                 status = resp.status_code
-                duration = time.perf_counter() - start
-                return ToolResult(
-                    task_id="",
-                    command=f"web {method} {url}",
-                    stdout=content,
-                    stderr="",
-                    returncode=status,
-                    duration=duration,
-                )
+                body = bytearray()
+                async for chunk in resp.aiter_bytes():
+                    body.extend(chunk)
+                    if len(body) >= byte_cap:
+                        break
+            content = _truncate_decode(bytes(body), self.config.max_output_chars)
+            duration = time.perf_counter() - start
+            return ToolResult(
+                task_id="",
+                command=f"web {method} {url}",
+                stdout=content,
+                stderr="",
+                returncode=status,
+                duration=duration,
+            )
         except Exception as exc:  # noqa: BLE001
             duration = time.perf_counter() - start
             return ToolResult(
@@ -88,16 +163,74 @@ class ToolRunner:
                 duration=duration,
             )
 
+    async def _ssh_connection(self, host: str, username: Optional[str], port: int) -> tuple:
+        """Return a pooled connection and whether it was freshly opened.
+
+        The lock guards only the pool bookkeeping; the connect itself runs
+        as a shared task awaited outside it, so a slow or unreachable host
+        delays only same-key callers instead of every SSH command.
+        """
+        import asyncssh  # type: ignore
+
+        key = (host, username, port)
+        async with self._ssh_lock:
+            now = time.monotonic()
+            for other, last in list(self._ssh_last_used.items()):
+                if other != key and now - last > _SSH_IDLE_SECONDS:
+                    idle = self._ssh_pool.pop(other, None)
+                    del self._ssh_last_used[other]
+                    if idle is not None:
+                        self._close_pooled(idle)
+            task = self._ssh_pool.get(key)
+            fresh = task is None
+            if fresh:
+                task = asyncio.create_task(asyncssh.connect(host, username=username, port=port))
+                self._ssh_pool[key] = task
+            self._ssh_last_used[key] = now
+        try:
+            # Shielded so a cancelled caller leaves the shared connect
+            # running for whoever asks next
+            conn = await asyncio.shield(task)
+        except BaseException:
+            if task.done():
+                # The connect itself failed; drop it so the next attempt
+                # retries instead of replaying the cached exception
+                async with self._ssh_lock:
+                    if self._ssh_pool.get(key) is task:
+                        del self._ssh_pool[key]
+                        self._ssh_last_used.pop(key, None)
+            raise
+        return conn, fresh
+
+    @staticmethod
+    def _close_pooled(task: "asyncio.Task") -> None:
+        """Close the connection behind a pooled connect task, if it opened."""
+        if not task.done():
+            task.cancel()
+        elif not task.cancelled() and task.exception() is None:
+            task.result().close()
+
+    async def _discard_ssh(self, host: str, username: Optional[str], port: int) -> None:
+        key = (host, username, port)
+        async with self._ssh_lock:
+            task = self._ssh_pool.pop(key, None)
+            self._ssh_last_used.pop(key, None)
+        if task is not None:
+            self._close_pooled(task)
+
     async def run_ssh(self, host: str, command: str, username: Optional[str] = None, port: int = 22) -> ToolResult:
         start = time.perf_counter()
         try:
-            import asyncssh  # type: ignore
-
-            conn = await asyncssh.connect(host, username=username, port=port)
+            conn, fresh = await self._ssh_connection(host, username, port)
             try:
                 result = await conn.run(command, check=False)
-            finally:
-                conn.close()
+            except Exception:
+                if fresh:
+                    raise
+                # The pooled connection went stale; reconnect and retry once
+                await self._discard_ssh(host, username, port)
+                conn, _ = await self._ssh_connection(host, username, port)
+                result = await conn.run(command, check=False)
             duration = time.perf_counter() - start
             return ToolResult(
                 task_id="",
@@ -121,20 +254,15 @@ class ToolRunner:
     async def run_serial(self, port: str, payload: str, baudrate: int = 115200, read_seconds: int = 2) -> ToolResult:
         start = time.perf_counter()
         try:
-            import serial  # type: ignore
-
-            ser = serial.Serial(port, baudrate=baudrate, timeout=1)
-            try:
-                ser.write(payload.encode())
-                await asyncio.sleep(read_seconds)
-                output = ser.read(ser.in_waiting or 1).decode(errors="replace")
-            finally:
-                ser.close()
+            # pyserial's calls block, so the whole exchange runs on a worker
+            # thread; it returns as soon as the device goes idle rather than
+            # sleeping out the full window
+            raw = await asyncio.to_thread(_serial_exchange, port, payload, baudrate, read_seconds)
             duration = time.perf_counter() - start
             return ToolResult(
                 task_id="",
                 command=f"serial {port}",
-                stdout=output[: self.config.max_output_chars],
+                stdout=_truncate_decode(raw, self.config.max_output_chars),
                 stderr="",
                 returncode=0,
                 duration=duration,
@@ -151,7 +279,8 @@ class ToolRunner:
             )
 
     def submit_background(self, command: str, timeout: Optional[int] = None) -> str:
-        task_id = str(uuid.uuid4())
+        # hex skips the dashed str() formatting; same 128 random bits
+        task_id = uuid.uuid4().hex
         task = asyncio.create_task(self._run_and_queue(task_id, command, timeout))
         self._tasks[task_id] = task
         task.add_done_callback(lambda _: self._tasks.pop(task_id, None))
@@ -161,9 +290,37 @@ class ToolRunner:
         result = await self.run_command(command, timeout=timeout)
         result.task_id = task_id
         await self._results.put(result)
+        if self.result_event is not None:
+            self.result_event.set()
 
     async def next_result(self, timeout: float = 0) -> Optional[ToolResult]:
+        """Get the next result, or None when none arrives within timeout.
+
+        An already-queued result is returned synchronously; wait_for with a
+        zero timeout would cancel the get before it could observe one.
+        """
+        try:
+            return self._results.get_nowait()
+        except asyncio.QueueEmpty:
+            if timeout <= 0:
+                return None
         try:
             return await asyncio.wait_for(self._results.get(), timeout=timeout)
         except asyncio.TimeoutError:
             return None
+
+    def has_activity(self) -> bool:
+        """True when background tasks are running or results await draining."""
+        return bool(self._tasks) or not self._results.empty()
+
+    def drain_results(self) -> List[ToolResult]:
+        """Pop every currently available result without awaiting."""
+        if not self.has_activity():
+            return []
+        results: List[ToolResult] = []
+        while True:
+            try:
+                results.append(self._results.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        return results
@@ -4,7 +4,7 @@ import asyncio
 from dataclasses import dataclass
 from typing import AsyncIterator, Optional
 
-import httpx
+from .http import get_client
 
 
 @dataclass
@@ -35,34 +35,33 @@ class ElevenLabsTTS(TTSClient):
         self.model = model
 
     async def synthesize(self, text: str) -> bytes:
-        async with httpx.AsyncClient(timeout=60) as client:
-            resp = await client.post(
-                f"https://api.elevenlabs.io/v1/text-to-speech/{self.voice_id}",
-                headers={
-                    "xi-api-key": self.api_key,
-                    "accept": "audio/mpeg",
-                    "Content-Type": "application/json",
-                },
-                json={"text": text, "model_id": self.model},
-            )
-            resp.raise_for_status()
-            return resp.content
+        resp = await get_client().post(
+            f"https://api.elevenlabs.io/v1/text-to-speech/{self.voice_id}",
+            headers={
+                "xi-api-key": self.api_key,
+                "accept": "audio/mpeg",
+                "Content-Type": "application/json",
+            },
+            json={"text": text, "model_id": self.model},
+        )
+        resp.raise_for_status()
+        return resp.content
 
     async def stream_synthesize(self, text: str) -> AsyncIterator[SpeechChunk]:
-        async with httpx.AsyncClient(timeout=120) as client:
-            async with client.stream(
-                "POST",
-                f"https://api.elevenlabs.io/v1/text-to-speech/{self.voice_id}/stream",
-                headers={
-                    "xi-api-key": self.api_key,
-                    "accept": "audio/mpeg",
-                    "Content-Type": "application/json",
-                },
-                json={"text": text, "model_id": self.model},
-            ) as resp:
-                resp.raise_for_status()
-                async for chunk in resp.aiter_bytes():
-                    yield SpeechChunk(audio=chunk, is_final=False)
+        async with get_client().stream(
+            "POST",
+            f"https://api.elevenlabs.io/v1/text-to-speech/{self.voice_id}/stream",
+            headers={
+                "xi-api-key": self.api_key,
+                "accept": "audio/mpeg",
+                "Content-Type": "application/json",
+            },
+            json={"text": text, "model_id": self.model},
+            timeout=120,
+        ) as resp:
+            resp.raise_for_status()
+            async for chunk in resp.aiter_bytes():
+                yield SpeechChunk(audio=chunk, is_final=False)
         yield SpeechChunk(audio=b"", is_final=True)
 
 
@@ -73,21 +72,25 @@ class OpenAITTS(TTSClient):
         self.voice = voice
 
     async def synthesize(self, text: str) -> bytes:
-        async with httpx.AsyncClient(timeout=60) as client:
-            resp = await client.post(
-                "https://api.openai.com/v1/audio/speech",
-                headers={"Authorization": f"Bearer {self.api_key}", "Content-Type": "application/json"},
-                json={"model": self.model, "voice": self.voice, "input": text},
-            )
-            resp.raise_for_status()
-            return resp.content
+        resp = await get_client().post(
+            "https://api.openai.com/v1/audio/speech",
+            headers={"Authorization": f"Bearer {self.api_key}", "Content-Type": "application/json"},
+            json={"model": self.model, "voice": self.voice, "input": text},
+        )
+        resp.raise_for_status()
+        return resp.content
 
     async def stream_synthesize(self, text: str) -> AsyncIterator[SpeechChunk]:
-        # OpenAI TTS doesn't support streaming yet, so we'll get the full audio and yield it
-        audio = await self.synthesize(text)
-        # Split into chunks for smoother playback
-        chunk_size = 4096
-        for i in range(0, len(audio), chunk_size):
-            chunk = audio[i : i + chunk_size]
-            yield SpeechChunk(audio=chunk, is_final=(i + chunk_size >= len(audio)))
+        # The speech endpoint supports chunked transfer, so audio is yielded
+        # as it arrives instead of after full synthesis
+        async with get_client().stream(
+            "POST",
+            "https://api.openai.com/v1/audio/speech",
+            headers={"Authorization": f"Bearer {self.api_key}", "Content-Type": "application/json"},
+            json={"model": self.model, "voice": self.voice, "input": text},
+            timeout=120,
+        ) as resp:
+            resp.raise_for_status()
+            async for chunk in resp.aiter_bytes(chunk_size=4096):
+                yield SpeechChunk(audio=chunk, is_final=False)
         yield SpeechChunk(audio=b"", is_final=True)
@@ -1,14 +1,33 @@
+"""Energy-based voice activity detection.
+
+The per-frame energy check here is the one compute-bound inner loop in the
+agent; everything else hot (LLM, tool, TTS/STT paths) is I/O-bound and is
+optimized by overlapping and caching rather than by vectorization.
+"""
+
 from __future__ import annotations
 
-import audioop
 from typing import AsyncIterator, Iterable, List
 
+from ._pcm import above_threshold
 from .audio import AudioFrame
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+# Frames per vectorized energy pass in segment_frames; 10 x 20 ms frames
+# bounds the added segmentation latency at ~200 ms.
+_SEGMENT_BATCH_FRAMES = 10
+
 
 class EnergyVAD:
     def __init__(self, threshold: int = 500, speech_frames: int = 3, silence_frames: int = 5) -> None:
         self.threshold = threshold
+        # Energies compare squared against threshold^2, skipping the per-
+        # frame sqrt entirely
+        self._threshold_sq = threshold * threshold
         self.speech_frames = speech_frames
         self.silence_frames = silence_frames
         self._speech_count = 0
@@ -18,27 +37,59 @@ class EnergyVAD:
         self._speech_count = 0
         self._silence_count = 0
 
+    def needs_reset(self) -> bool:
+        """False when both hysteresis counters are already at zero."""
+        return bool(self._speech_count or self._silence_count)
+
     def is_speech(self, frame: AudioFrame) -> bool:
-        energy = audioop.rms(frame.data, 2)
-        if energy >= self.threshold:
-            self._speech_count += 1
-            self._silence_count = 0
-        else:
-            self._silence_count += 1
+        # Energy scoring is shared with the wake detector via _pcm
+        return self._advance(above_threshold(frame.data, self._threshold_sq))
+
+    def is_speech_batch(self, frames: List[AudioFrame]) -> List[bool]:
+        """Classify a batch of frames with one vectorized energy pass."""
+        if np is None or len({len(frame.data) for frame in frames}) != 1:
+            return [self.is_speech(frame) for frame in frames]
+        stacked = np.stack([np.frombuffer(frame.data, dtype=np.int16) for frame in frames])
+        above = np.mean(np.square(stacked, dtype=np.int32), axis=1) >= self._threshold_sq
+        return [self._advance(bool(flag)) for flag in above]
+
+    def _advance(self, above: bool) -> bool:
+        # Branchless hysteresis: counters reset via integer multiplies
+        # instead of per-frame if/else chains
+        above = int(above)
+        self._speech_count += above
+        self._silence_count = (self._silence_count + 1 - above) * (1 - above)
         speaking = self._speech_count >= self.speech_frames
-        if self._silence_count >= self.silence_frames:
-            self._speech_count = 0
+        self._speech_count *= self._silence_count < self.silence_frames
         return speaking
 
 
-async def segment_frames(frames: AsyncIterator[AudioFrame], vad: EnergyVAD) -> AsyncIterator[List[AudioFrame]]:
+async def segment_frames(
+    frames: AsyncIterator[AudioFrame],
+    vad: EnergyVAD,
+    batch_size: int = _SEGMENT_BATCH_FRAMES,
+) -> AsyncIterator[List[AudioFrame]]:
     current: List[AudioFrame] = []
+    batch: List[AudioFrame] = []
+
+    def flush() -> List[List[AudioFrame]]:
+        nonlocal current
+        segments: List[List[AudioFrame]] = []
+        for frame, speech in zip(batch, vad.is_speech_batch(batch)):
+            if speech:
+                current.append(frame)
+            elif current:
+                segments.append(current)
+                current = []
+        batch.clear()
+        return segments
+
     async for frame in frames:
-        if vad.is_speech(frame):
-            current.append(frame)
-            continue
-        if current:
-            yield current
-            current = []
+        batch.append(frame)
+        if len(batch) >= batch_size:
+            for segment in flush():
+                yield segment
+    for segment in flush():
+        yield segment
     if current:
         yield current
@@ -1,6 +1,14 @@
+"""Streaming voice loop and TTS playback.
+
+This is the only voice-loop module; TTSPlayer always plays through
+BufferedAudioPlayer, with the playback hook as the unbuffered escape
+hatch.
+"""
+
 from __future__ import annotations
 
 import asyncio
+import gc
 from typing import AsyncIterator, Callable, Optional
 
 from .audio import AudioFrame, AudioFrontend
@@ -14,11 +22,58 @@ from .wake import WakeDetector
 
 PlaybackHook = Callable[[bytes, bool], asyncio.Future | None]
 
+# Streamed response text is synthesized a segment at a time; segments cut
+# at the last sentence break once at least this much text is pending, so
+# synthesis overlaps LLM decode without producing choppy fragments.
+_SEGMENT_MIN_CHARS = 60
+_SEGMENT_BREAKS = ".!?\n"
+
+# Fallback-poll backoff bounds for the background loop: empty polls double
+# the interval toward the cap, any delivered turn snaps it back down.
+_BG_POLL_MIN = 0.1
+_BG_POLL_MAX = 2.0
+
+
+def _segment_end(text: str) -> int:
+    """Offset just past the last sentence break, or 0 if too short to cut."""
+    best = 0
+    for ch in _SEGMENT_BREAKS:
+        idx = text.rfind(ch)
+        if idx + 1 > best:
+            best = idx + 1
+    return best if best >= _SEGMENT_MIN_CHARS else 0
+
+
+class _FrameIterator:
+    """Async view over an already-materialized frame list.
+
+    Cheaper than wrapping the list in a throwaway async generator: one
+    object per utterance and a plain list-iterator step per frame, with no
+    generator frame to create, suspend, and resume.
+    """
+
+    __slots__ = ("_it",)
+
+    def __init__(self, frames: list[AudioFrame]) -> None:
+        self._it = iter(frames)
+
+    def __aiter__(self) -> "_FrameIterator":
+        return self
+
+    async def __anext__(self) -> AudioFrame:
+        try:
+            return next(self._it)
+        except StopIteration:
+            raise StopAsyncIteration from None
+
 
 class TTSPlayer:
     def __init__(self, tts: TTSClient, playback_hook: Optional[PlaybackHook] = None, sample_rate: int = 24000) -> None:
         self.tts = tts
         self.playback_hook = playback_hook
+        # Whether the hook returns something awaitable is invariant for a
+        # given hook; probed on the first chunk and cached
+        self._hook_returns_awaitable: Optional[bool] = None
         self._task: Optional[asyncio.Task[None]] = None
         self._buffered_player = BufferedAudioPlayer(
             sample_rate=sample_rate,
@@ -27,18 +82,29 @@ class TTSPlayer:
             playback_callback=lambda chunk: self._play_chunk(chunk) if self.playback_hook else None,
         )
 
-    def _play_chunk(self, chunk: bytes) -> Optional[asyncio.Future]:
+    def _play_chunk(self, chunk: "bytes | memoryview") -> Optional[asyncio.Future]:
         """Internal method to play a single audio chunk."""
-        if self.playback_hook:
-            maybe_future = self.playback_hook(chunk, False)
-            if asyncio.isfuture(maybe_future) or asyncio.iscoroutine(maybe_future):
-                return maybe_future
-        return None
+        if not self.playback_hook:
+            return None
+        maybe_future = self.playback_hook(chunk, False)
+        if self._hook_returns_awaitable is None:
+            self._hook_returns_awaitable = asyncio.isfuture(maybe_future) or asyncio.iscoroutine(maybe_future)
+        return maybe_future if self._hook_returns_awaitable else None
 
     def is_playing(self) -> bool:
         return self._task is not None and not self._task.done()
 
     async def stop(self) -> None:
+        # Fast path for the common barge-in where nothing is playing: a
+        # parked playback loop counts as idle, so this fires between
+        # utterances and keeps the loop alive for reuse
+        if (self._task is None or self._task.done()) and not self._buffered_player.is_active():
+            self._task = None
+            return
+        await self.close()
+
+    async def close(self) -> None:
+        """Tear everything down, including a parked playback loop."""
         await self._buffered_player.stop()
         if self._task and not self._task.done():
             self._task.cancel()
@@ -48,18 +114,22 @@ class TTSPlayer:
                 pass
         self._task = None
 
-    async def play(self, text: str) -> None:
+    async def play(self, text: "str | AsyncIterator[str]") -> None:
+        """Play a complete response, or a stream of response text chunks.
+
+        An async iterator is synthesized a sentence segment at a time as
+        text arrives, so playback starts while the LLM is still decoding.
+        """
         await self.stop()
-        self._task = asyncio.create_task(self._stream(text))
+        if isinstance(text, str):
+            self._task = asyncio.create_task(self._stream(text))
+        else:
+            self._task = asyncio.create_task(self._stream_segments(text))
 
     async def _stream(self, text: str) -> None:
         await self._buffered_player.start_stream()
         try:
-            async for chunk in self.tts.stream_synthesize(text):
-                if chunk.audio:
-                    await self._buffered_player.add_chunk(chunk.audio)
-                if chunk.is_final:
-                    break
+            await self._synthesize_into(text)
             await self._buffered_player.finish_stream()
         except asyncio.CancelledError:
             await self._buffered_player.stop()
@@ -68,6 +138,35 @@ class TTSPlayer:
             await self._buffered_player.stop()
             raise
 
+    async def _stream_segments(self, chunks: "AsyncIterator[str]") -> None:
+        await self._buffered_player.start_stream()
+        try:
+            pending = ""
+            async for piece in chunks:
+                pending += piece
+                cut = _segment_end(pending)
+                if cut:
+                    await self._synthesize_into(pending[:cut])
+                    pending = pending[cut:]
+            if pending.strip():
+                await self._synthesize_into(pending)
+            await self._buffered_player.finish_stream()
+        except asyncio.CancelledError:
+            await self._buffered_player.stop()
+            raise
+        except Exception:
+            await self._buffered_player.stop()
+            raise
+
+    async def _synthesize_into(self, text: str) -> None:
+        """Stream one piece of text through TTS into the buffered player."""
+        async for chunk in self.tts.stream_synthesize(text):
+            if chunk.audio:
+                # memoryview keeps any downstream slicing zero-copy
+                await self._buffered_player.add_chunk(memoryview(chunk.audio))
+            if chunk.is_final:
+                break
+
 
 class VoiceLoop:
     def __init__(
@@ -78,6 +177,7 @@ class VoiceLoop:
         tts_player: TTSPlayer,
         idle: Optional[IdleManager] = None,
         background_poll_interval: float = 0.5,
+        enable_gc_freeze: bool = True,
     ) -> None:
         self.audio = audio
         self.stt = stt
@@ -85,6 +185,7 @@ class VoiceLoop:
         self.tts_player = tts_player
         self.idle = idle
         self.background_poll_interval = background_poll_interval
+        self.enable_gc_freeze = enable_gc_freeze
         self._background_task: Optional[asyncio.Task[None]] = None
         self._running = False
 
@@ -94,6 +195,12 @@ class VoiceLoop:
         self._background_task = asyncio.create_task(self._background_loop())
         if self.idle:
             await self.idle.start()
+        if self.enable_gc_freeze:
+            # Everything alive at this point lives for the whole session;
+            # freezing it keeps the collector from re-traversing it during
+            # streaming. Objects allocated afterwards age normally.
+            gc.collect()
+            gc.freeze()
 
     async def stop(self) -> None:
         self._running = False
@@ -104,7 +211,10 @@ class VoiceLoop:
                 await self._background_task
             except asyncio.CancelledError:
                 pass
-        await self.tts_player.stop()
+        await self.tts_player.close()
+        # Summaries run off the critical path; collect any still in flight
+        # so shutdown does not drop the final turn's summary
+        await self.dialog.wait_for_summaries()
         if self.idle:
             await self.idle.stop()
 
@@ -112,63 +222,115 @@ class VoiceLoop:
         transcript = await self._collect_transcript(frames)
         if not transcript:
             return None
-        await self.tts_player.stop()  # barge-in: stop current playback
-        turn = await self.dialog.handle_user_text(transcript)
-        await self.tts_player.play(turn.response_text)
+        return await self._respond(transcript)
+
+    async def _respond(self, transcript: str) -> Optional[DialogTurn]:
+        # Barge-in: tearing down playback and producing the reply are
+        # independent, so they run concurrently; playback teardown only has
+        # to be done before the new reply starts playing.
+        stop_task = asyncio.create_task(self.tts_player.stop())
+        # Dialog speech streams through a queue into the player, so
+        # synthesis and playback start while the LLM is still responding.
+        speech_queue: "asyncio.Queue[Optional[str]]" = asyncio.Queue()
+        streamed = False
+
+        async def on_chunk(piece: str) -> None:
+            nonlocal streamed
+            streamed = True
+            await speech_queue.put(piece)
+
+        async def speech_iter() -> AsyncIterator[str]:
+            while True:
+                piece = await speech_queue.get()
+                if piece is None:
+                    return
+                yield piece
+
+        dialog_task = asyncio.create_task(self.dialog.handle_user_text(transcript, on_response_chunk=on_chunk))
+        try:
+            await stop_task
+            await self.tts_player.play(speech_iter())
+            turn = await dialog_task
+        except BaseException:
+            dialog_task.cancel()
+            await speech_queue.put(None)
+            raise
+        if not streamed and turn.response_text:
+            # Turns resolved without streaming (prefix handlers) still speak
+            await speech_queue.put(turn.response_text)
+        await speech_queue.put(None)
         if self.idle:
             self.idle.touch()
         return turn
 
     async def run_stream(self, frames: AsyncIterator[AudioFrame], vad: EnergyVAD, wake: Optional[WakeDetector] = None) -> None:
-        current_frames: list[AudioFrame] = []
+        # Speech is collected as raw PCM in one growing buffer rather than
+        # one AudioFrame object per 20 ms frame
+        current_pcm = bytearray()
         listening = wake is None
-        vad.reset()
-        if wake:
+        if vad.needs_reset():
+            vad.reset()
+        if wake and wake.needs_reset():
             wake.reset()
 
         async for frame in frames:
             if wake and not listening:
-                if await wake.process(frame):
+                if wake.process(frame):
                     listening = True
-                    vad.reset()
+                    if vad.needs_reset():
+                        vad.reset()
                 continue
 
             if vad.is_speech(frame):
-                current_frames.append(frame)
+                current_pcm.extend(frame.data)
                 continue
 
-            if current_frames:
-                await self._handle_utterance(current_frames)
-                current_frames = []
+            if current_pcm:
+                await self._handle_utterance(bytes(current_pcm))
+                current_pcm.clear()
                 listening = wake is None
-                if wake:
+                if wake and wake.needs_reset():
                     wake.reset()
-                vad.reset()
+                if vad.needs_reset():
+                    vad.reset()
 
-        if current_frames:
-            await self._handle_utterance(current_frames)
+        if current_pcm:
+            await self._handle_utterance(bytes(current_pcm))
 
     async def _collect_transcript(self, frames: AsyncIterator[AudioFrame]) -> str:
         text = ""
         async for chunk in self.stt.stream_transcribe(frames):
-            if chunk.text:
-                text = chunk.text if chunk.final else chunk.text
             if chunk.final:
-                break
+                return (chunk.text or text).strip()
+            if chunk.text:
+                text = chunk.text
         return text.strip()
 
-    async def _handle_utterance(self, frames: list[AudioFrame]) -> None:
-        async def gen() -> AsyncIterator[AudioFrame]:
-            for frame in frames:
-                yield frame
-
-        await self.run_once(gen())
+    async def _handle_utterance(self, pcm: bytes) -> None:
+        # A complete utterance skips the streaming interface: one batch
+        # transcription call, then the normal response pipeline
+        transcript = await self.stt.transcribe_batch(pcm)
+        if transcript:
+            await self._respond(transcript)
 
     async def _background_loop(self) -> None:
+        # Park on the dialog's background event when it has one; the poll
+        # interval is only a fallback timeout, not a duty cycle, and it
+        # backs off while the session is quiet
+        event = getattr(self.dialog, "background_event", None)
+        interval = self.background_poll_interval
         while self._running:
+            if event is not None:
+                try:
+                    await asyncio.wait_for(event.wait(), timeout=interval)
+                except asyncio.TimeoutError:
+                    pass
+                event.clear()
+            else:
+                await asyncio.sleep(interval)
             turns = await self.dialog.poll_background()
+            interval = _BG_POLL_MIN if turns else min(interval * 2, _BG_POLL_MAX)
             for turn in turns:
                 await self.tts_player.play(turn.response_text)
                 if self.idle:
                     self.idle.touch()
-            await asyncio.sleep(self.background_poll_interval)
@@ -1,49 +1,132 @@
 from __future__ import annotations
 
-import audioop
 from typing import Optional
 
+from ._pcm import sum_squares
 from .audio import AudioFrame
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+# Frames buffered per vectorized wake pass; 4 x 20 ms frames adds at most
+# ~60 ms to wake latency, well under the consecutive-frame requirement.
+_WAKE_BATCH_FRAMES = 4
+
+
+def _wake_step(data: bytes, threshold_sq: int, count: int, consecutive: int) -> "tuple[bool, int]":
+    """One fused energy + counter update for a frame.
+
+    The whole per-frame step lives in a single call — energy reduction and
+    a branchless integer counter update — threading the counter through as
+    an argument instead of touching detector attributes mid-computation.
+    Comparison is sum-of-squares against threshold^2 * n, so no sqrt is
+    taken and everything stays in integer arithmetic; the energy itself
+    comes from the shared _pcm helper.
+    """
+    ss, n = sum_squares(data)
+    count = (count + 1) * (n > 0 and ss >= threshold_sq * n)
+    return count >= consecutive, count
+
 
 class WakeDetector:
-    async def process(self, frame: AudioFrame) -> bool:
+    # Empty slots so slotted subclasses stay free of per-instance dicts
+    __slots__ = ()
+
+    # process is deliberately synchronous: detectors here do pure
+    # computation, and a coroutine per 20 ms frame is measurable overhead.
+    # A detector that genuinely needs I/O should expose its own async entry
+    # point rather than making every frame pay for it.
+    def process(self, frame: AudioFrame) -> bool:
         raise NotImplementedError
 
     def reset(self) -> None:
         return
 
+    def needs_reset(self) -> bool:
+        """False when reset() would be a no-op; default is conservative."""
+        return True
+
 
 class EnergyWakeDetector(WakeDetector):
+    # The per-frame loop reads these constantly; slot descriptors beat
+    # dict lookups and shave ~100 bytes per instance
+    __slots__ = ("threshold", "_threshold_sq", "consecutive", "_count", "_pending", "_scratch")
+
     def __init__(self, threshold: int = 1200, consecutive: int = 5) -> None:
         self.threshold = threshold
+        # RMS >= threshold is checked as sum(s^2) >= threshold^2 * n,
+        # skipping the per-frame sqrt as in EnergyVAD
+        self._threshold_sq = threshold * threshold
         self.consecutive = consecutive
         self._count = 0
+        self._pending: "list[bytes]" = []
+        # int32 scratch reused across batched passes; grown on demand so
+        # the steady state allocates nothing per flush
+        self._scratch = None
+
+    def process(self, frame: AudioFrame) -> bool:
+        if np is None:
+            detected, self._count = _wake_step(frame.data, self._threshold_sq, self._count, self.consecutive)
+            return detected
+        # Frames are buffered and reduced in one vectorized pass, so the
+        # idle wake path pays one numpy dispatch per batch rather than per
+        # frame; cf. is_speech_batch in vad.py.
+        self._pending.append(frame.data)
+        if len(self._pending) < _WAKE_BATCH_FRAMES:
+            return False
+        return self._flush()
 
-    async def process(self, frame: AudioFrame) -> bool:
-        energy = audioop.rms(frame.data, 2)
-        if energy >= self.threshold:
-            self._count += 1
-        else:
-            self._count = 0
-        return self._count >= self.consecutive
+    def _flush(self) -> bool:
+        batch, self._pending = self._pending, []
+        detected = False
+        frame_len = len(batch[0])
+        if frame_len and all(len(data) == frame_len for data in batch):
+            samples = np.frombuffer(b"".join(batch), dtype=np.int16)
+            if self._scratch is None or self._scratch.size < samples.size:
+                self._scratch = np.empty(samples.size, dtype=np.int32)
+            squares = self._scratch[: samples.size]
+            np.copyto(squares, samples)
+            np.multiply(squares, squares, out=squares)
+            squares = squares.reshape(len(batch), -1)
+            # int64 accumulator: the int32 squares overflow a same-width
+            # sum on loud frames
+            above = squares.sum(axis=1, dtype=np.int64) >= self._threshold_sq * squares.shape[1]
+            for frame_above in above:
+                self._count = (self._count + 1) * bool(frame_above)
+                detected = detected or self._count >= self.consecutive
+            return detected
+        for data in batch:
+            step, self._count = _wake_step(data, self._threshold_sq, self._count, self.consecutive)
+            detected = detected or step
+        return detected
 
     def reset(self) -> None:
         self._count = 0
+        self._pending.clear()
+
+    def needs_reset(self) -> bool:
+        return bool(self._count or self._pending)
 
 
 class ManualWakeDetector(WakeDetector):
+    __slots__ = ("_armed",)
+
     def __init__(self) -> None:
         self._armed = True
 
     def trigger(self) -> None:
         self._armed = True
 
-    async def process(self, frame: AudioFrame) -> bool:
-        if self._armed:
-            self._armed = False
-            return True
-        return False
+    def process(self, frame: AudioFrame) -> bool:
+        # Swap instead of branch: the disarmed common case is two plain
+        # attribute operations per frame
+        armed, self._armed = self._armed, False
+        return armed
 
     def reset(self) -> None:
         self._armed = True
+
+    def needs_reset(self) -> bool:
+        return not self._armed